@@ -0,0 +1,172 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Arc conversion: Vector/Matrix endpoint to center vs float math, scalar and batch.
+
+Also checks that new and former arc edges have the same end points and
+length, then times the whole edge construction of an arc heavy path.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_arcs.py
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from DraftVecUtils import angle as angle_between_vectors  # type: ignore
+from FreeCAD import Matrix, Vector  # type: ignore
+from Part import Arc, Ellipse  # type: ignore
+
+from freecad.svgwb.svg.bounds import arc_center, arc_centers
+from freecad.svgwb.svg.path import arc_edge
+
+ARCS = 20_000
+REPEAT = 3
+TOLERANCE = 1e-6
+
+
+def legacy_arc_end_to_center(last_v, current_v, rx, ry, x_rotation):  # noqa: ANN001, ANN201
+    """Former geom.arc_end_to_center (with correction), both solutions."""
+    v0 = last_v.sub(current_v)
+    v0.multiply(0.5)
+    m1 = Matrix()
+    m1.rotateZ(-x_rotation)
+    v1 = m1.multiply(v0)
+    e_param = v1.x**2 / rx**2 + v1.y**2 / ry**2
+    if e_param > 1:
+        ep_root = math.sqrt(e_param)
+        rx, ry = ep_root * rx, ep_root * ry
+    denom = rx**2 * v1.y**2 + ry**2 * v1.x**2
+    numer = rx**2 * ry**2 - denom
+    try:
+        scale_fact_pos = math.sqrt(numer / denom) if abs(numer / denom) >= TOLERANCE else 0
+    except ValueError:
+        scale_fact_pos = 0
+    results = []
+    for scale_fact_sign in (1, -1):
+        scale_fact = scale_fact_pos * scale_fact_sign
+        vcx1 = Vector(v1.y * rx / ry, -v1.x * ry / rx, 0).multiply(scale_fact)
+        m2 = Matrix()
+        m2.rotateZ(x_rotation)
+        center_off = current_v.add(last_v)
+        center_off.multiply(0.5)
+        v_center = m2.multiply(vcx1).add(center_off)
+        angle1 = angle_between_vectors(
+            Vector(1, 0, 0),
+            Vector((v1.x - vcx1.x) / rx, (v1.y - vcx1.y) / ry, 0),
+        )
+        angle_delta = angle_between_vectors(
+            Vector((v1.x - vcx1.x) / rx, (v1.y - vcx1.y) / ry, 0),
+            Vector((-v1.x - vcx1.x) / rx, (-v1.y - vcx1.y) / ry, 0),
+        )
+        results.append((v_center, angle1, angle_delta))
+    return results, (rx, ry)
+
+
+def legacy_arc_edge(row: tuple[float, ...]):  # noqa: ANN201
+    """Former arc edge construction of create_edges."""
+    lx, ly, nx, ny, rx, ry, x_rotation, large_flag, sweep_flag = row
+    solution, (rx, ry) = legacy_arc_end_to_center(
+        Vector(lx, ly, 0),
+        Vector(nx, ny, 0),
+        rx,
+        ry,
+        math.radians(-x_rotation),
+    )
+    v_center, angle1, angle_delta = solution[large_flag != sweep_flag]
+    swap_axis = ry > rx
+    if swap_axis:
+        rx, ry = ry, rx
+    e1 = Ellipse(v_center, rx, ry)
+    if sweep_flag:
+        angle1, angle_delta = angle1 + angle_delta, -angle_delta
+    d90 = math.radians(90)
+    seg = Arc(e1, angle1 - swap_axis * d90, angle1 + angle_delta - swap_axis * d90).toShape()
+    if swap_axis:
+        seg.rotate(v_center, Vector(0, 0, 1), 90)
+    if abs(x_rotation) > TOLERANCE:
+        seg.rotate(v_center, Vector(0, 0, 1), -x_rotation)
+    if sweep_flag:
+        seg.reverse()
+    return seg
+
+
+def new_arc_edge(row: tuple[float, ...]):  # noqa: ANN201
+    lx, ly, nx, ny, rx, ry, x_rotation, large_flag, sweep_flag = row
+    phi = math.radians(x_rotation)
+    return arc_edge(arc_center(lx, -ly, nx, -ny, rx, ry, phi, large_flag, sweep_flag), phi)
+
+
+def random_arcs(n: int) -> list[tuple[float, ...]]:
+    """Rows in FreeCAD orientation: (x1, y1, x2, y2, rx, ry, degrees, large, sweep)."""
+    rnd = random.Random(1)  # noqa: S311  # nosec B311
+    return [
+        (
+            rnd.uniform(-50, 50),
+            rnd.uniform(-50, 50),
+            rnd.uniform(-50, 50),
+            rnd.uniform(-50, 50),
+            rnd.uniform(1, 40),
+            rnd.uniform(1, 40),
+            rnd.choice((0.0, rnd.uniform(-180, 180))),
+            float(rnd.random() < 0.5),
+            float(rnd.random() < 0.5),
+        )
+        for _ in range(n)
+    ]
+
+
+def check(rows: list[tuple[float, ...]]) -> None:
+    for row in rows:
+        old, new = legacy_arc_edge(row), new_arc_edge(row)
+        old_ends = (old.firstVertex(True).Point, old.lastVertex(True).Point)
+        new_ends = (new.firstVertex(True).Point, new.lastVertex(True).Point)
+        same_ends = all(a.isEqual(b, TOLERANCE) for a, b in zip(old_ends, new_ends, strict=True))
+        if not same_ends or abs(old.Length - new.Length) > TOLERANCE * old.Length:
+            msg = f"arc {row}: former {old_ends} {old.Length}, new {new_ends} {new.Length}"
+            raise AssertionError(msg)
+
+
+def best(fn, *args) -> float:  # noqa: ANN001
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    rows = random_arcs(ARCS)
+    check(rows[:1000])
+    svg_rows = [
+        (x1, -y1, x2, -y2, rx, ry, math.radians(rot), large, sweep)
+        for x1, y1, x2, y2, rx, ry, rot, large, sweep in rows
+    ]
+
+    def legacy_centers() -> None:
+        for x1, y1, x2, y2, rx, ry, rot, _, _ in rows:
+            start, end = Vector(x1, y1, 0), Vector(x2, y2, 0)
+            legacy_arc_end_to_center(start, end, rx, ry, math.radians(-rot))
+
+    def scalar_centers() -> None:
+        for row in svg_rows:
+            arc_center(*row)
+
+    results = {
+        "centers, Vector/Matrix": best(legacy_centers),
+        "centers, float math": best(scalar_centers),
+        "centers, batch": best(arc_centers, svg_rows),
+        "edges, former": best(lambda: [legacy_arc_edge(row) for row in rows]),
+        "edges, new": best(lambda: [new_arc_edge(row) for row in rows]),
+    }
+    for name, elapsed in results.items():
+        print(f"{name:>24}: {elapsed:.3f}s ({ARCS / elapsed:,.0f} arcs/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Compare the xml parser backends (xml.sax vs direct expat) on a corpus of svg files.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_backends.py [file.svg | directory ...]
+
+Without arguments a synthetic document is generated in a temporary directory.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.parser import parse
+
+BACKENDS = ("sax", "expat")
+REPEAT = 3
+
+
+def synthetic(folder: Path, size: int = 100_000) -> Path:
+    rows = [
+        f'<path id="p{i}" style="fill:#ff0000;stroke:#000000" d="M {i} 0 L {i + 1} 1 Z"/>'
+        for i in range(size)
+    ]
+    file = folder / "synthetic.svg"
+    file.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100mm" height="100mm" '
+        f"viewBox='0 0 100 100'><g id='layer1'>{''.join(rows)}</g></svg>",
+    )
+    return file
+
+
+def corpus(args: list[str]) -> list[Path]:
+    files: list[Path] = []
+    for arg in args:
+        path = Path(arg)
+        files.extend(sorted(path.glob("**/*.svg")) if path.is_dir() else [path])
+    return files
+
+
+def main(args: list[str]) -> None:
+    pref = SvgImportPreferences()
+    with TemporaryDirectory() as tmp:
+        files = corpus(args) or [synthetic(Path(tmp))]
+        totals = dict.fromkeys(BACKENDS, 0.0)
+        for file in files:
+            size = file.stat().st_size / 1024 / 1024
+            times = {}
+            for backend in BACKENDS:
+                best = float("inf")
+                for _ in range(REPEAT):
+                    start = time.perf_counter()
+                    parse(file, pref, backend=backend)
+                    best = min(best, time.perf_counter() - start)
+                times[backend] = best
+                totals[backend] += best
+            ratio = times["sax"] / times["expat"]
+            print(
+                f"{file.name:<40} {size:8.2f} MiB  "
+                f"sax {times['sax']:.3f}s  expat {times['expat']:.3f}s  ({ratio:.2f}x)",
+            )
+        print(f"{'total':<40} {'':>12}  sax {totals['sax']:.3f}s  expat {totals['expat']:.3f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,85 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Large symbol libraries with few instances: eager vs lazy <defs>/<symbol> content.
+
+The eager handler reproduces the former parser, where the content of <defs>
+and <symbol> was attached to the document and built as visible geometry.
+Reports parse time, geometry build time of all objects and python heap peak.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_defs.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import corpus
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.object import build_shapes
+from freecad.svgwb.svg.parser import (
+    HashingReader,
+    SvgContentHandler,
+    SvgParseResult,
+    parse_expat,
+)
+
+SYMBOLS = (100, 1_000, 10_000)
+USES = 50
+
+
+class EagerHandler(SvgContentHandler):
+    """Former behavior: no templates, everything is parsed in place."""
+
+    def startDefs(self, _tag: str, _attrs: dict[str, str]) -> None:
+        self.count -= 1
+
+    def startSymbol(self, tag: str, attrs: dict[str, str]) -> None:
+        self.startSvg(tag, attrs)
+
+
+def measure(file: Path, handler_type: type[SvgContentHandler]) -> tuple[float, float, int, int]:
+    pref = SvgImportPreferences()
+    tracemalloc.start()
+    start = time.perf_counter()
+    handler = handler_type(pref)
+    with file.open("rb") as stream:
+        reader = HashingReader(stream)
+        parse_expat(reader, handler)
+    result = SvgParseResult(handler.root, handler.index, reader.hexdigest())
+    parsed = time.perf_counter()
+    objects = list(result.objects())
+    shapes = build_shapes(objects)
+    built = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed - start, built - parsed, len(shapes), peak
+
+
+def main() -> None:
+    with TemporaryDirectory() as tmp:
+        for symbols in SYMBOLS:
+            spec = corpus.CorpusSpec(
+                paths=0, depth=0, symbols=symbols, uses=USES, texts=0, holes=0,
+            )
+            file = corpus.write(Path(tmp) / f"library{symbols}.svg", spec)
+            for name, handler_type in (("eager", EagerHandler), ("lazy", SvgContentHandler)):
+                parse_time, build_time, count, peak = measure(file, handler_type)
+                print(
+                    f"symbols={symbols:>6} {name:<5}: parse {parse_time:.3f}s, "
+                    f"build {build_time:.3f}s ({count} shapes), "
+                    f"peak {peak / 2**20:.1f} MiB",
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Micro-benchmark: per-element dispatch overhead of SvgContentHandler.
+
+Compares the precompiled dispatch table against the former
+getattr(self, f"start{tag.capitalize()}") lookup.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_dispatch.py
+"""
+
+from __future__ import annotations
+
+import time
+from xml import sax  # nosec B406: trusted generated input
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.parser import SvgContentHandler
+
+ELEMENTS = 200_000
+UNHANDLED = ("sodipodi:namedview", "metadata", "title", "desc", "inkscape:grid")
+
+
+class LegacyDispatchHandler(SvgContentHandler):
+    """Handler using the per-element getattr dispatch."""
+
+    def startElement(self, tag: str, attrs: dict[str, str]) -> None:
+        if self.muted:
+            self.muted.append(tag)
+            return
+        if handler := getattr(self, f"start{tag.capitalize()}", None):
+            self.count += 1
+            handler(tag, attrs)
+
+    def endElement(self, tag: str) -> None:
+        if self.muted:
+            self.muted.pop()
+            return
+        if handler := getattr(self, f"end{tag.capitalize()}", None):
+            handler(tag)
+
+
+def make_document(size: int) -> bytes:
+    """Flat document mixing unhandled and cheap handled elements."""
+    parts = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">',
+    ]
+    for i in range(size):
+        if i % 4:
+            parts.append(f"<{UNHANDLED[i % len(UNHANDLED)]}/>")
+        else:
+            parts.append(f'<g id="g{i}"/>')
+    parts.append("</svg>")
+    return "".join(parts).encode()
+
+
+def run(handler_cls: type[SvgContentHandler], doc: bytes, pref: SvgImportPreferences) -> float:
+    handler = handler_cls(pref)
+    start = time.perf_counter()
+    sax.parseString(doc, handler)  # noqa: S317  # nosec B317
+    return time.perf_counter() - start
+
+
+def dispatch_only(handler_cls: type[SvgContentHandler], pref: SvgImportPreferences) -> float:
+    """Time startElement/endElement for unhandled tags only (pure dispatch cost)."""
+    handler = handler_cls(pref)
+    handler.stack.append(None)  # Skip root namespace binding
+    tags = [UNHANDLED[i % len(UNHANDLED)] for i in range(ELEMENTS)]
+    attrs = {}
+    start = time.perf_counter()
+    for tag in tags:
+        handler.startElement(tag, attrs)
+        handler.endElement(tag)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    pref = SvgImportPreferences()
+    doc = make_document(ELEMENTS)
+    for name, cls in (("getattr", LegacyDispatchHandler), ("table", SvgContentHandler)):
+        total = min(run(cls, doc, pref) for _ in range(3))
+        bare = min(dispatch_only(cls, pref) for _ in range(3))
+        print(
+            f"{name:>8}: parse {total:.3f}s ({total / ELEMENTS * 1e9:.0f} ns/element), "
+            f"dispatch {bare / ELEMENTS * 1e9:.0f} ns/element",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+End to end import benchmark, results as JSON.
+
+Times each stage separately: parse, to_shape, svg_to_sql,
+SvgActionFeature.on_execute and export.export.
+
+Run headless with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_e2e.py [--output results.json] [--file a.svg ...]
+        [--paths N --segments N --depth N --symbols N --uses N --texts N --holes N --seed N]
+
+Without --file a synthetic document is generated (see corpus.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import FreeCAD as App  # type: ignore
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import corpus
+
+from freecad.svgwb.features.svg_action import QueryType, SvgActionFeature
+from freecad.svgwb.features.svg_file import SvgFileFeature
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg import export
+from freecad.svgwb.svg.parser import parse
+
+STAGES = ("parse", "to_shape", "svg_to_sql", "on_execute", "export")
+
+
+def script_args() -> list[str]:
+    """Arguments after this script, FreeCADCmd keeps its own arguments in sys.argv."""
+    name = Path(__file__).name
+    for i, arg in enumerate(sys.argv):
+        if arg.endswith(name):
+            return sys.argv[i + 1 :]
+    return sys.argv[1:]
+
+
+def timed(fn, *args, **kwargs) -> tuple[float, object]:  # noqa: ANN001
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def bench_file(file: Path, repeat: int, out_dir: Path) -> dict:
+    pref = SvgImportPreferences()
+    timings: dict[str, float] = {}
+
+    timings["parse"] = min(timed(parse, file, pref)[0] for _ in range(repeat))
+
+    # Geometry is cached per shape, so each round needs a fresh parse
+    best = float("inf")
+    for _ in range(repeat):
+        objects = list(parse(file, pref).objects())
+        elapsed, _ = timed(lambda objs: [obj.shape.to_shape() for obj in objs], objects)
+        best = min(best, elapsed)
+    timings["to_shape"] = best
+
+    doc = App.newDocument("SvgBenchmark")
+    try:
+        source = SvgFileFeature.create(name="SvgFile", doc=doc)
+        source.Proxy.internal_file = str(file)
+        action = SvgActionFeature.create(name="SvgA001", doc=doc)
+        # Query first: the action is not executed until it has a source
+        action.Proxy.query_type = QueryType.All
+        action.Source = source
+
+        timings["svg_to_sql"], _ = timed(source.Proxy.svg_to_sql)
+        report = asdict(source.Proxy.import_report)
+        timings["on_execute"], _ = timed(action.recompute)
+
+        features = [obj for obj in doc.Objects if getattr(obj, "SvgAction", None) is action]
+        timings["export"], _ = timed(export.export, out_dir / f"{file.stem}.out.svg", features)
+    finally:
+        App.closeDocument(doc.Name)
+
+    return {
+        "file": file.name,
+        "bytes": file.stat().st_size,
+        "objects": len(objects),
+        "timings": timings,
+        "import_report": report,
+    }
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description="End to end import benchmark")
+    parser.add_argument("--file", type=Path, action="append", default=[])
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--repeat", type=int, default=3)
+    corpus.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    spec = corpus.spec_from(args)
+    with TemporaryDirectory() as tmp:
+        files = args.file or [corpus.write(Path(tmp) / "synthetic.svg", spec)]
+        report = {
+            "benchmark": "e2e",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "freecad": ".".join(App.Version()[:3]),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "stages": STAGES,
+            "corpus": None if args.file else asdict(spec),
+            "results": [bench_file(file, args.repeat, Path(tmp)) for file in files],
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main(script_args())
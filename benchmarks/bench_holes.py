@@ -0,0 +1,60 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Perforated panel: direct holed faces vs sequential boolean cuts.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_holes.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import Part  # type: ignore
+from FreeCAD import Vector  # type: ignore
+
+from freecad.svgwb.svg.face_tree import FaceTreeNode
+
+HOLES = (100, 500, 2000)
+PITCH = 10.0
+
+
+def panel(holes: int) -> FaceTreeNode:
+    side = int(holes**0.5) + 1
+    size = side * PITCH
+    tree = FaceTreeNode()
+    corners = [Vector(0, 0), Vector(size, 0), Vector(size, size), Vector(0, size), Vector(0, 0)]
+    outer = Part.makePolygon(corners)
+    tree.insert(Part.Face(outer), "panel")
+    for i in range(holes):
+        row, col = divmod(i, side)
+        center = Vector((col + 0.5) * PITCH, (row + 0.5) * PITCH, 0)
+        tree.insert(Part.Face(Part.Wire(Part.makeCircle(PITCH / 4, center))), f"hole{i}")
+    return tree
+
+
+def measure(holes: int, *, direct: bool) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    tree = panel(holes)
+    inserted = time.perf_counter()
+    tree.make_cuts(direct=direct)
+    done = time.perf_counter()
+    area = sum(face.Area for face in tree.flatten())
+    return inserted - start, done - inserted, area
+
+
+def main() -> None:
+    for holes in HOLES:
+        for direct in (True, False):
+            insert, cuts, area = measure(holes, direct=direct)
+            mode = "direct" if direct else "boolean"
+            print(
+                f"holes={holes:>5} {mode:>8}: insert {insert:.3f}s, faces {cuts:.3f}s, "
+                f"area {area:.3f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
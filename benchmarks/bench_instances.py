@@ -0,0 +1,68 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Many <use> instances of a few symbols: geometry per instance vs placed once built.
+
+Without a base shape every instance builds its own geometry, as the former
+SvgUse did. Instances created by SvgShape.placed transform the geometry
+of the shared target instead. Reports time and process RSS growth.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_instances.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import corpus
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.parser import parse
+
+USES = (1_000, 10_000, 50_000)
+SYMBOLS = 3
+
+
+def rss() -> int:
+    """Resident set size in bytes (Linux)."""
+    with Path("/proc/self/statm").open() as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def measure(file: Path, *, shared: bool) -> tuple[float, int, int]:
+    result = parse(file, SvgImportPreferences())
+    objects = list(result.objects())
+    if not shared:
+        for obj in objects:
+            vars(obj.shape).pop("_base", None)
+    before = rss()
+    start = time.perf_counter()
+    shapes = [shape for obj in objects if (shape := obj.shape.to_shape())]
+    elapsed = time.perf_counter() - start
+    return elapsed, len(shapes), rss() - before
+
+
+def main() -> None:
+    with TemporaryDirectory() as tmp:
+        for uses in USES:
+            spec = corpus.CorpusSpec(
+                paths=0, depth=0, symbols=SYMBOLS, uses=uses, texts=0, holes=0,
+            )
+            file = corpus.write(Path(tmp) / f"instances{uses}.svg", spec)
+            for name, shared in (("per instance", False), ("placed", True)):
+                elapsed, count, grown = measure(file, shared=shared)
+                print(
+                    f"uses={uses:>6} {name:<12}: {elapsed:.3f}s ({count} shapes), "
+                    f"rss +{grown / 2**20:.1f} MiB",
+                )
+
+
+if __name__ == "__main__":
+    main()
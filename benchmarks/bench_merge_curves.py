@@ -0,0 +1,75 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Smooth outlines: one edge per bezier vs merged bspline runs.
+
+Outlines are closed wavy loops of tangent continuous cubics, like traced
+bitmaps or font glyphs.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_merge_curves.py
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+from Part import Face  # type: ignore
+
+from freecad.svgwb.svg.geom import make_wire
+from freecad.svgwb.svg.path import PathCommands, create_edges
+from freecad.svgwb.svg.path_data import PathData
+
+SEGMENTS = (50, 500, 5000)
+PRECISION = 3
+
+
+def outline(segments: int, radius: float = 100.0) -> str:
+    """Closed loop of cubics with matching tangents at every join."""
+
+    def point(a: float) -> tuple[float, float, float, float]:
+        r = radius * (1 + 0.1 * math.sin(7 * a))
+        dr = radius * 0.7 * math.cos(7 * a)
+        # Position and derivative by the angle
+        return (
+            r * math.cos(a),
+            r * math.sin(a),
+            dr * math.cos(a) - r * math.sin(a),
+            dr * math.sin(a) + r * math.cos(a),
+        )
+
+    step = 2 * math.pi / segments
+    x, y, dx, dy = point(0)
+    d = [f"M{x:.6f},{y:.6f}"]
+    for i in range(1, segments + 1):
+        nx, ny, ndx, ndy = point(i * step)
+        d.append(
+            f"C{x + dx * step / 3:.6f},{y + dy * step / 3:.6f} "
+            f"{nx - ndx * step / 3:.6f},{ny - ndy * step / 3:.6f} {nx:.6f},{ny:.6f}",
+        )
+        x, y, dx, dy = nx, ny, ndx, ndy
+    d.append("Z")
+    return " ".join(d)
+
+
+def measure(d: str, *, merge: bool) -> tuple[float, int, float]:
+    start = time.perf_counter()
+    data = PathData.from_commands(PathCommands(d), PRECISION)
+    edges = create_edges(data, 0, 100, PRECISION, merge)
+    face = Face(make_wire(edges, PRECISION, check_closed=True))
+    return time.perf_counter() - start, len(edges), face.Area
+
+
+def main() -> None:
+    for segments in SEGMENTS:
+        d = outline(segments)
+        for merge in (False, True):
+            elapsed, edges, area = measure(d, merge=merge)
+            mode = "merged" if merge else "bezier"
+            print(f"segments={segments:>5} {mode}: {elapsed:.3f}s, {edges} edges, area {area:.4f}")
+
+
+if __name__ == "__main__":
+    main()
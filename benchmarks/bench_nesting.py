@@ -0,0 +1,75 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Deeply nested groups: transform at every level vs once per leaf.
+
+Documents are generated like Inkscape layers and sublayers: a chain of
+nested <g> elements, each one with its own transform and a few leaves.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_nesting.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import corpus
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.group import SvgGroup
+from freecad.svgwb.svg.parser import parse
+
+DEPTHS = (8, 32, 128)
+REPEAT = 3
+
+
+def legacy_shapes(node: SvgGroup) -> list:
+    """Former SvgGroup.shapes: every level transforms all of its descendants."""
+    shapes = []
+    for child in node._children:  # noqa: SLF001
+        if isinstance(child, SvgGroup):
+            shapes.extend(legacy_shapes(child))
+        elif hasattr(child, "shapes"):
+            shapes.extend(child.shapes())
+        elif shape := child.to_shape():
+            shapes.append(shape)
+    return [s.transformGeometry(node.transform) for s in shapes if s]
+
+
+def measure(file: Path, *, deferred: bool) -> tuple[float, int]:
+    pref = SvgImportPreferences()
+    best = float("inf")
+    count = 0
+    for _ in range(REPEAT):
+        # Geometry is cached per shape, so each round needs a fresh parse
+        root = parse(file, pref).root
+        start = time.perf_counter()
+        shapes = root.shapes() if deferred else legacy_shapes(root)
+        best = min(best, time.perf_counter() - start)
+        count = len(shapes)
+    return best, count
+
+
+def main() -> None:
+    with TemporaryDirectory() as tmp:
+        for depth in DEPTHS:
+            spec = corpus.CorpusSpec(paths=0, depth=depth, symbols=0, uses=0, texts=0, holes=0)
+            file = corpus.write(Path(tmp) / f"nesting{depth}.svg", spec)
+            legacy, n_legacy = measure(file, deferred=False)
+            deferred, n_deferred = measure(file, deferred=True)
+            print(
+                f"depth={depth:>4}: per level {legacy:.3f}s ({n_legacy} shapes), "
+                f"per leaf {deferred:.3f}s ({n_deferred} shapes), "
+                f"speedup {legacy / deferred:.1f}x",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Path data tokenizer throughput (MB/s).
+
+Compares the single pass scanner (parsers.tokenize_path) against the former
+regex split + parse_floats approach. The tokenizer corpus is checked by
+tests/test_path_tokenizer.py.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_path_tokenizer.py
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import time
+
+from freecad.svgwb.svg.parsers import parse_floats, tokenize_path
+
+REPEAT = 5
+SEGMENTS = 200_000
+
+
+class LegacyPathCommands:
+    """Regex split on command letters, then parse_floats on each argument string."""
+
+    regex = re.compile(
+        "\\s*?([mMlLhHvVaAcCqQsStTzZ])\\s*?([^mMlLhHvVaAcCqQsStTzZ]*)\\s*?",
+        re.DOTALL,
+    )
+
+    def __init__(self, d: str) -> None:
+        self.commands = [(cmd, parse_floats(args)) for cmd, args in self.regex.findall(d)]
+
+
+def make_path(size: int) -> str:
+    """Mixed, compactly written path data similar to optimizer (svgo) output."""
+    rnd = random.Random(1)  # noqa: S311  # nosec B311
+
+    def num() -> str:
+        return f"{rnd.uniform(-500, 500):.3f}".replace("0.", ".")
+
+    parts = ["M0 0"]
+    for i in range(size):
+        match i % 5:
+            case 0:
+                parts.append(f"l{num()}{num()}")
+            case 1:
+                parts.append(f"c{num()} {num()} {num()} {num()} {num()} {num()}")
+            case 2:
+                parts.append(f"a{abs(rnd.uniform(1, 50)):.2f} 3 0 01{num()} {num()}")
+            case 3:
+                parts.append(f"h{num()}v{num()}")
+            case _:
+                parts.append(f"q{num()},{num()},{num()},{num()}")
+    parts.append("z")
+    return "".join(parts)
+
+
+def throughput(label: str, d: str, fn) -> None:  # noqa: ANN001
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(d)
+        best = min(best, time.perf_counter() - start)
+    size = len(d) / 1024 / 1024
+    print(f"{label:>8}: {size:.2f} MiB in {best:.3f}s = {size / best:.1f} MiB/s")
+
+
+def main() -> None:
+    d = make_path(SEGMENTS)
+    throughput("regex", d, LegacyPathCommands)
+    throughput("scanner", d, tokenize_path)
+
+
+if __name__ == "__main__":
+    main()
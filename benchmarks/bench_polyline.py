@@ -0,0 +1,102 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Large polylines: one LineSegment per point pair vs a single makePolygon.
+
+Reports time and memory (python heap peak and process RSS growth) of
+SvgPolyLine.to_shape for GIS like point lists.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_polyline.py
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from DraftVecUtils import equals  # type: ignore
+from FreeCAD import Vector  # type: ignore
+from Part import LineSegment, Wire  # type: ignore
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg.parser import parse
+
+SIZES = (10_000, 100_000, 1_000_000)
+LEGACY_MAX = 100_000  # The former code takes minutes beyond this
+
+
+def rss() -> int:
+    """Resident set size in bytes (Linux)."""
+    with Path("/proc/self/statm").open() as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def document(points: int) -> str:
+    rnd = random.Random(points)  # noqa: S311  # nosec B311
+    x = y = 0.0
+    coords = []
+    for _ in range(points):
+        x += rnd.uniform(0, 0.1)
+        y += rnd.uniform(-0.1, 0.1)
+        coords.append(f"{x:.4f},{y:.4f}")
+        if rnd.random() < 0.01:  # noqa: PLR2004
+            # Duplicated point, as found in exported tracks
+            coords.append(coords[-1])
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1000">'
+        f'<polyline id="track" points="{" ".join(coords)}" style="fill:none;stroke:#000"/>'
+        "</svg>"
+    )
+
+
+def legacy_to_shape(points: list[float]) -> Wire:
+    """Former SvgPolyLine.to_shape, without transformation."""
+    last_v = Vector(points[0], -points[1], 0)
+    path = []
+    for svg_x, svg_y in zip(points[2::2], points[3::2], strict=False):
+        current_v = Vector(svg_x, -svg_y, 0)
+        if not equals(last_v, current_v):
+            path.append(LineSegment(last_v, current_v).toShape())
+            last_v = current_v
+    return Wire(path)
+
+
+def measure(fn, *args) -> tuple[float, int, int, object]:  # noqa: ANN001
+    tracemalloc.start()
+    before = rss()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    growth = rss() - before
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, growth, result
+
+
+def main() -> None:
+    pref = SvgImportPreferences()
+    with TemporaryDirectory() as tmp:
+        for size in SIZES:
+            file = Path(tmp) / f"polyline{size}.svg"
+            file.write_text(document(size))
+            polyline = next(parse(file, pref).objects()).shape
+            runs = [("makePolygon", polyline.to_shape)]
+            if size <= LEGACY_MAX:
+                runs.append(("LineSegment", lambda p=polyline: legacy_to_shape(p.points)))
+            for name, fn in runs:
+                elapsed, peak, growth, shape = measure(fn)
+                print(
+                    f"points={size:>8} {name:>12}: {elapsed:7.3f}s, "
+                    f"python peak {peak / 2**20:7.1f} MiB, rss +{growth / 2**20:7.1f} MiB, "
+                    f"{len(shape.Edges)} edges",
+                )
+                del shape
+
+
+if __name__ == "__main__":
+    main()
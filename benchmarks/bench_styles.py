@@ -0,0 +1,80 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Memory and time report: interned vs per-element style resolution.
+
+Run with FreeCAD's python:
+    FreeCADCmd benchmarks/bench_styles.py
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from freecad.svgwb.preferences import SvgImportPreferences
+from freecad.svgwb.svg import parsers
+from freecad.svgwb.svg.style import SvgColor, SvgStyle, SvgStyleCache
+
+SIZES = (10_000, 100_000, 500_000)
+
+# Typical Inkscape export: a handful of distinct style strings repeated everywhere
+STYLES = (
+    "fill:none;stroke:#000000;stroke-width:0.264583;stroke-linecap:butt;stroke-opacity:1",
+    "fill:#ff6600;fill-opacity:1;stroke:none;stroke-width:0.5",
+    "fill:#cccccc;stroke:#333333;stroke-width:1px;font-size:12px",
+    "opacity:0.5;fill:#00ff00;stroke:#000000;stroke-width:0.1",
+)
+
+
+def legacy_style(parent: SvgStyle, attrs: dict[str, str], dpi: float) -> SvgStyle:
+    """Per-element resolution as done before interning (new objects every time)."""
+    pairs = attrs.get("style", "").split(";")
+    pairs = (tuple(v.strip() for v in pair.split(":")) for pair in pairs)
+    data = dict(v for v in pairs if len(v) == 2)  # noqa: PLR2004
+    fill = data.get("fill")
+    stroke = data.get("stroke")
+    width = data.get("stroke-width")
+    font_size = data.get("font-size")
+    return SvgStyle(
+        parent.stroke_color if not stroke or stroke == "none" else SvgColor(stroke),
+        parent.stroke_width if not width else parsers.parse_size(width, f"css{dpi!s}"),
+        None if not fill or fill == "none" else SvgColor(fill),
+        parent.font_size if not font_size else parsers.parse_size(font_size, f"css{dpi!s}"),
+    )
+
+
+def measure(label: str, size: int, resolve) -> None:  # noqa: ANN001
+    elements = [{"style": STYLES[i % len(STYLES)]} for i in range(size)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    styles = [resolve(attrs) for attrs in elements]
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    unique = len({id(s) for s in styles})
+    print(
+        f"{label:>9} n={size:>7}: {elapsed:.3f}s, retained {current / 1024 / 1024:.1f} MiB, "
+        f"{unique} distinct style objects",
+    )
+
+
+def main() -> None:
+    pref = SvgImportPreferences()
+    dpi = 96.0
+    for size in SIZES:
+        cache = SvgStyleCache()
+        parent = cache.style(
+            stroke_color=pref.line_color(),
+            stroke_width=pref.line_width(),
+            fill_color=pref.fill_color(),
+            font_size=pref.font_size(),
+        )
+        measure("legacy", size, lambda attrs: legacy_style(parent, attrs, dpi))  # noqa: B023
+        measure("interned", size, lambda attrs: cache.resolve(parent, attrs, dpi))  # noqa: B023
+        print(f"{'':>9} cache hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Reproducible synthetic svg corpus with tunable scale.
+
+Each feature stresses a different part of the import:
+    paths: long open paths mixing lines, cubics, quadratics and arcs.
+    depth: a chain of nested <g> elements, each one with its own transform.
+    symbols/uses: <symbol> templates instantiated by many <use> elements.
+    texts: text elements.
+    holes: filled shapes with holes (and islands inside the holes).
+
+Plain python, no FreeCAD required:
+    python benchmarks/corpus.py out.svg --paths 100 --segments 1000 --depth 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+CELL = 50.0  # Grid cell size, each generated element gets its own cell
+
+
+@dataclass
+class CorpusSpec:
+    """Scale of each feature of the generated document."""
+
+    paths: int = 100
+    segments: int = 200
+    depth: int = 20
+    symbols: int = 5
+    uses: int = 500
+    texts: int = 100
+    holes: int = 100
+    seed: int = 1
+
+
+class _Grid:
+    """Allocate non overlapping cells, row by row."""
+
+    def __init__(self, columns: int) -> None:
+        self.columns = max(1, columns)
+        self.index = 0
+
+    def next(self) -> tuple[float, float]:
+        row, col = divmod(self.index, self.columns)
+        self.index += 1
+        return col * CELL, row * CELL
+
+    @property
+    def size(self) -> tuple[float, float]:
+        rows = self.index // self.columns + 1
+        return self.columns * CELL, rows * CELL
+
+
+def _path_data(rnd: random.Random, x: float, y: float, segments: int) -> str:
+    """Relative path wandering inside a cell, starting at (x, y)."""
+    d = [f"M{x + CELL / 2:.3f},{y + CELL / 2:.3f}"]
+    px = py = 0.0
+    for i in range(segments):
+        # Steer back towards the cell center to stay inside
+        dx = rnd.uniform(-2, 2) - px * 0.05
+        dy = rnd.uniform(-2, 2) - py * 0.05
+        match i % 4:
+            case 0:
+                d.append(f"l{dx:.3f},{dy:.3f}")
+            case 1:
+                d.append(f"c{dx / 3:.3f},{-dy:.3f} {dx:.3f},{dy * 2:.3f} {dx:.3f},{dy:.3f}")
+            case 2:
+                d.append(f"q{dx:.3f},{-dy:.3f} {dx:.3f},{dy:.3f}")
+            case _:
+                d.append(f"a{abs(dx) + 1:.3f},{abs(dy) + 1:.3f} 0 0,1 {dx:.3f},{dy:.3f}")
+        px += dx
+        py += dy
+    return "".join(d)
+
+
+def _holed(x: float, y: float, *, island: bool) -> str:
+    """Square with a square hole, and optionally an island inside the hole."""
+    d = [
+        f"M{x + 5},{y + 5}h40v40h-40z",
+        f"M{x + 15},{y + 15}v20h20v-20z",
+    ]
+    if island:
+        d.append(f"M{x + 20},{y + 20}h10v10h-10z")
+    return "".join(d)
+
+
+def generate(spec: CorpusSpec) -> str:
+    rnd = random.Random(spec.seed)  # noqa: S311  # nosec B311
+    grid = _Grid(round((spec.paths + spec.uses + spec.texts + spec.holes + 1) ** 0.5))
+    body: list[str] = []
+    defs = [
+        f'<symbol id="sym{i}">'
+        f'<path id="sym{i}_p" d="M5,5 L{10 + i},40 C20,45 40,45 45,{5 + i}" '
+        'style="fill:none;stroke:#000000;stroke-width:0.5"/>'
+        f'<circle id="sym{i}_c" cx="25" cy="25" r="{5 + i % 10}" style="fill:#3366ff"/>'
+        "</symbol>"
+        for i in range(spec.symbols)
+    ]
+
+    body.append('<g id="long_paths">')
+    for i in range(spec.paths):
+        x, y = grid.next()
+        body.append(
+            f'<path id="path{i}" d="{_path_data(rnd, x, y, spec.segments)}" '
+            'style="fill:none;stroke:#000000;stroke-width:0.2"/>',
+        )
+    body.append("</g>")
+
+    x, y = grid.next()
+    body.append(f'<g id="nested" transform="translate({x},{y})">')
+    for i in range(spec.depth):
+        body.append(f'<g id="level{i}" transform="translate(0.5,0.5) rotate(1) scale(0.99)">')
+        body.append(f'<rect id="level{i}_r" width="10" height="5" style="fill:#999999"/>')
+    body.append("</g>" * spec.depth)
+    body.append("</g>")
+
+    if spec.symbols:
+        body.append('<g id="instances">')
+        for i in range(spec.uses):
+            x, y = grid.next()
+            body.append(f'<use id="use{i}" href="#sym{i % spec.symbols}" x="{x}" y="{y}"/>')
+        body.append("</g>")
+
+    body.append('<g id="texts">')
+    for i in range(spec.texts):
+        x, y = grid.next()
+        body.append(
+            f'<text id="text{i}" x="{x + 5}" y="{y + 25}" style="font-size:8px">Text {i}</text>',
+        )
+    body.append("</g>")
+
+    body.append('<g id="holes">')
+    for i in range(spec.holes):
+        x, y = grid.next()
+        body.append(
+            f'<path id="holed{i}" d="{_holed(x, y, island=i % 3 == 0)}" '
+            'style="fill:#ff6600;fill-rule:evenodd;stroke:#000000;stroke-width:0.2"/>',
+        )
+    body.append("</g>")
+
+    width, height = grid.size
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width}mm" height="{height}mm" viewBox="0 0 {width} {height}">'
+        f"<defs>{''.join(defs)}</defs>{''.join(body)}</svg>"
+    )
+
+
+def write(path: Path, spec: CorpusSpec) -> Path:
+    path.write_text(generate(spec), encoding="utf-8")
+    return path
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    for field in fields(CorpusSpec):
+        parser.add_argument(f"--{field.name}", type=int, default=field.default)
+
+
+def spec_from(args: argparse.Namespace) -> CorpusSpec:
+    return CorpusSpec(**{field.name: getattr(args, field.name) for field in fields(CorpusSpec)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output", type=Path)
+    add_arguments(parser)
+    args = parser.parse_args()
+    write(args.output, spec_from(args))
+
+
+if __name__ == "__main__":
+    main()
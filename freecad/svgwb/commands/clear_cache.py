@@ -0,0 +1,31 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+from __future__ import annotations
+
+from ..config import resources, commands
+from ..vendor.fcapi.lang import QT_TRANSLATE_NOOP
+
+import FreeCAD as App  # type: ignore
+
+
+@commands.add(
+    label=QT_TRANSLATE_NOOP("SvgWB", "Clear geometry cache"),
+    tooltip=QT_TRANSLATE_NOOP("SvgWB", "Remove geometry of svg elements cached on disk"),
+    status_tip=QT_TRANSLATE_NOOP("SvgWB", "Remove geometry of svg elements cached on disk"),
+    icon=resources.icon("svg-db.svg"),
+)
+class ClearGeometryCache:
+    """Remove all cached BREP files, they are rebuilt on the next sync."""
+
+    def on_activated(self) -> None:
+        from ..svg.brep_cache import BrepCache, cache_dir
+        from ..svg.cache import shape_cache
+        from ..vendor.fcapi.fcui import print_log
+
+        shape_cache.clear()
+        removed = BrepCache(cache_dir(), 0).clear()
+        print_log(f"svg geometry cache: {removed / 2**20:.1f} MiB removed")
+
+    def is_active(self) -> bool:
+        return App.GuiUp
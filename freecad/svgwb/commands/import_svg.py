@@ -51,6 +51,7 @@ def import_svg(svg_file: str) -> None:
         result = parser.parse(svg_file, pref, 96.0)
         proc = processor.PlainSvgImporter(result, doc)
         proc.execute()
+        result.release()
 
         App.Gui.runCommand("Std_OrthographicCamera", 1)
         App.Gui.SendMsgToActiveView("ViewFit")
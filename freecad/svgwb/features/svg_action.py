@@ -8,6 +8,7 @@ from enum import Enum
 
 from ..config import resources
 from ..svg.database import SvgDatabase, SvgEntity
+from ..svg.query import SvgQuery
 from ..vendor.fcapi import fpo
 from ..vendor.fcapi.utils import run_later
 from . import transformations as trsf
@@ -157,6 +158,24 @@ class SvgActionFeature(fpo.DataProxy):
             case _:
                 return db.find_all()
 
+    def svg_query(self) -> SvgQuery | None:
+        """In memory equivalent of execute_query, None means everything."""
+        if self.query_type == QueryType.All:
+            return None
+        if not self.validate():
+            return SvgQuery()
+        field = self.query_type.value.lower()
+        if self.query_type == QueryType.ByPath:
+            return SvgQuery([self.query], field)
+        return SvgQuery(self.query, field)
+
+    def affected_by(self, changes: list[SvgEntity]) -> bool:
+        """Check if any of the changed rows is, or was, part of the query result."""
+        query = self.svg_query()
+        if query is None:
+            return bool(changes)
+        return any(query.matches_entity(entity) for entity in changes)
+
     def select_behavior(self) -> FeatureBuilder:  # noqa: C901, PLR0911
         match self.output_type:
             case ShapeOutput.Sketch:
@@ -222,6 +241,10 @@ class SvgActionFeature(fpo.DataProxy):
                 return
 
             objects = self.execute_query()
+            if missing := [item.path for item in objects if item.brep is None]:
+                # Deferred by the last import, build only these objects
+                self.source.Proxy.build_missing(self.svg_query(), missing)
+                objects = [item for item in self.execute_query() if item.brep is not None]
             if not objects:
                 return
 
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from ..svg.database import SvgDatabase
+from ..svg.query import SvgQuery
 from ..vendor.fcapi import fcui as ui
 from .svg_action import SvgActionFeature, QueryType, ShapeOutput
 from typing import TYPE_CHECKING
@@ -35,24 +35,20 @@ class ResultsTree:
         ui.place_widget(self.tree)
 
     def search(self, field: QueryType, pattern: str) -> None:
-        db = SvgDatabase(self.action.source.SqlFile)
         tree = self.tree
         tree.clear()
         if field == QueryType.All or (pattern and pattern.strip()):
-            if field == QueryType.All:
-                data = db.find_all(include_brep=False)
-            else:
-                data = db.find_by_pattern(
-                    pattern.split(","),
-                    field.value.lower(),
-                    include_brep=False,
-                )
-            for entity in data:
+            # Index scan of the svg file, browsed without building geometry
+            data = self.action.source.Proxy.scan_objects()
+            if field != QueryType.All:
+                query = SvgQuery(pattern.split(","), field.value.lower())
+                data = [info for info in data if query.matches_entity(info)]
+            for info in data:
                 item = QTreeWidgetItem(tree)
-                item.setText(0, entity.tag)
-                item.setText(1, entity.id)
-                item.setText(2, entity.label)
-                item.setText(3, entity.path)
+                item.setText(0, info.tag)
+                item.setText(1, info.id)
+                item.setText(2, info.label)
+                item.setText(3, info.path)
 
 
 QueryTypeDict = {
@@ -4,25 +4,71 @@
 from __future__ import annotations
 
 from pathlib import Path
+from shutil import copyfile
 from tempfile import gettempdir
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from ..config import SvgImportPreferences, resources
+from ..svg.brep_cache import BrepCache, content_hash, geometry_key
+from ..svg.cache import shape_cache
 from ..svg.database import SvgDatabase, SvgEntity
+from ..svg.geom import wire_stats
 from ..svg.parser import parse
+from ..svg.query import SvgQuery
+from ..svg.report import ImportReport
 from ..vendor.fcapi import fpo
 from ..vendor.fcapi.lang import translate
 
 if TYPE_CHECKING:
     from collections.abc import Generator
     from FreeCAD import DocumentObject  # type: ignore
+    from ..svg.object import SvgObject, SvgObjectInfo
 
 
 def find_child_actions(parent: DocumentObject) -> Generator[DocumentObject, None, None]:
     return (obj for obj in parent.Document.Objects if getattr(obj, "Source", None) is parent)
 
 
+def build_entity(
+    obj: SvgObject,
+    digest: str,
+    report: ImportReport,
+    disk_cache: BrepCache | None,
+    *,
+    build: bool,
+) -> SvgEntity | None:
+    """Database row of obj, with geometry if build. None if the geometry is empty."""
+    brep = None
+    if build:
+        key = geometry_key(obj.shape) if disk_cache else None
+        brep = disk_cache.get(key) if key else None
+        if brep is None:
+            fallbacks = wire_stats.fallbacks
+            shape = obj.shape.to_shape()
+            report.track(obj.id, fallbacks)
+            brep = shape.exportBrepToString() if shape else ""
+            if key:
+                disk_cache.put(key, brep)
+        else:
+            report.reused += 1
+        if not brep:
+            report.empty += 1
+            return None
+        report.built += 1
+    else:
+        report.deferred += 1
+    return SvgEntity(
+        obj.id,
+        obj.shape.tag,
+        obj.shape.label,
+        obj.path,
+        obj.href,
+        brep,
+        digest,
+    )
+
+
 @fpo.view_proxy(icon=resources.icon("svg-db.svg"))
 class SvgFileViewProvider(fpo.ViewProxy):
     """ViewProvider for svg database objects."""
@@ -95,12 +141,25 @@ class SvgFileFeature(fpo.DataProxy):
     # md5 hash of internal_file
     file_hash = fpo.PropertyString(mode=HiddenOutputMode, section="Files")
 
+    # Statistics of the last svg_to_sql
+    import_report: ImportReport | None = None
+
+    # Index scan of internal_file: (file_hash, objects)
+    index_scan: tuple[str, list[SvgObjectInfo]] | None = None
+
     def sync_file(self) -> None:
         if self.external_file and Path(self.external_file).exists():
             self.internal_file = self.external_file
-            self.svg_to_sql()
-            self.Object.Document.recompute()
+            changes = self.update_sql()
+            affected = []
             for child in find_child_actions(self.Object):
+                if changes is None or child.Proxy.affected_by(changes):
+                    affected.append(child)
+                else:
+                    # Nothing shown by this action changed, keep its output
+                    child.Proxy.file_hash = self.file_hash
+            self.Object.Document.recompute()
+            for child in affected:
                 child.recompute()
 
     def create_action(self) -> None:
@@ -124,35 +183,202 @@ class SvgFileFeature(fpo.DataProxy):
     def on_external_file_change(self, _) -> None:
         self.sync_file()
 
+    def geometry_query(self) -> SvgQuery | None:
+        """
+        Union of the queries of all child actions.
+
+        None means that geometry is required for all objects.
+        """
+        queries = [child.Proxy.svg_query() for child in find_child_actions(self.Object)]
+        if not queries or any(query is None for query in queries):
+            return None
+        union = SvgQuery()
+        for query in queries:
+            union |= query
+        return union
+
+    def scan_objects(self) -> list[SvgObjectInfo]:
+        """
+        Metadata of all objects of internal_file, no geometry is built.
+
+        Kept until the file changes, so it can be browsed and filtered in memory.
+        """
+        if self.index_scan is None or self.index_scan[0] != self.file_hash:
+            if not (self.internal_file and Path(self.internal_file).exists()):
+                return []
+            result = parse(self.internal_file, SvgImportPreferences(), 96.0)
+            self.index_scan = (self.file_hash, list(result.scan()))
+        return self.index_scan[1]
+
     def svg_to_sql(self) -> None:
         from ..vendor.fcapi import fcui as ui
 
         with ui.progress_indicator(translate("SvgWB", "Importing svg elements...")):
             pref = SvgImportPreferences()
             dpi = 96.0
+            query = self.geometry_query()
             result = parse(self.internal_file, pref, dpi)
             self.file_hash = result.hash
             file_name = Path(gettempdir()) / f"{uuid4()!s}.sqlite"
             db = SvgDatabase(file_name)
             db.initialize()
-            shapes = ((obj, obj.shape.to_shape()) for obj in result.objects())
-            entities = (
-                SvgEntity(
-                    obj.id,
-                    obj.shape.tag,
-                    obj.shape.label,
-                    obj.path,
-                    obj.href,
-                    shape.exportBrepToString(),
-                )
-                for (obj, shape) in shapes
-                if shape
-            )
-            db.add_many_iter(entities)
-            self.sql_file = str(file_name)
 
-            if next(find_child_actions(self.Object), 0) == 0:
-                self.create_action()
+            report = ImportReport()
+            report.start()
+
+            # Geometry of unchanged elements is reused across syncs and documents
+            disk_cache = BrepCache.open(pref)
+
+            # Objects not required by any child action are stored without geometry,
+            # they are still listed while browsing and get built when queried.
+            def entities() -> Generator[SvgEntity, None, None]:
+                for obj in result.objects():
+                    report.objects += 1
+                    build = query is None or query.matches(obj)
+                    digest = content_hash(obj)
+                    if entity := build_entity(obj, digest, report, disk_cache, build=build):
+                        yield entity
+
+            # Built shapes are only exported, cached geometry needs no copies
+            with shape_cache.read_only():
+                db.add_many_iter(entities())
+            self.finish_import(file_name, report, disk_cache)
+            result.release()
+
+    def update_sql(self) -> list[SvgEntity] | None:
+        """
+        Apply the changes of internal_file to a copy of the current database.
+
+        Rows are compared by path and content hash, so only inserted or changed
+        objects are built. Return the old and new rows of everything that
+        changed, or None if a full import was required.
+        """
+        from ..vendor.fcapi import fcui as ui
+
+        current = self.sql_file
+        if not (current and Path(current).exists() and SvgDatabase(current).has_content_hashes()):
+            self.svg_to_sql()
+            return None
+
+        with ui.progress_indicator(translate("SvgWB", "Updating svg elements...")):
+            pref = SvgImportPreferences()
+            dpi = 96.0
+            query = self.geometry_query()
+            result = parse(self.internal_file, pref, dpi)
+            self.file_hash = result.hash
+            file_name = self.copy_database()
+            db = SvgDatabase(file_name)
+            rows = db.content_hashes()
+
+            report = ImportReport()
+            report.start()
+            disk_cache = BrepCache.open(pref)
+
+            stale: list[str] = []
+            entities: list[SvgEntity] = []
+            with shape_cache.read_only():
+                for obj in result.objects():
+                    report.objects += 1
+                    build = query is None or query.matches(obj)
+                    digest = content_hash(obj)
+                    row = rows.pop(obj.path, None)
+                    # Same content, and geometry available if it is required
+                    if row and row[0] == digest and (row[1] or not build):
+                        report.unchanged += 1
+                        continue
+                    if row:
+                        stale.append(obj.path)
+                    if entity := build_entity(obj, digest, report, disk_cache, build=build):
+                        entities.append(entity)
+
+            # Rows left belong to objects removed from the svg
+            stale.extend(rows)
+            changes = db.find_by_paths(stale, include_brep=False) + entities
+            db.replace_many(stale, entities)
+            self.finish_import(file_name, report, disk_cache)
+            result.release()
+            return changes
+
+    def build_missing(self, query: SvgQuery | None, paths: list[str]) -> None:
+        """
+        Build the geometry of rows stored without it, in the current database.
+
+        Used by child actions that need objects deferred by the last import,
+        only those objects are built and the other rows are kept. If
+        internal_file does not match file_hash anymore, the database is
+        synced with update_sql instead.
+        """
+        from ..vendor.fcapi import fcui as ui
+
+        with ui.progress_indicator(translate("SvgWB", "Building svg elements...")):
+            pref = SvgImportPreferences()
+            dpi = 96.0
+            result = parse(self.internal_file, pref, dpi, query)
+            if result.hash != self.file_hash:
+                # Rows were written from another content, do not mix both
+                self.update_sql()
+                return
+            missing = set(paths)
+
+            report = ImportReport()
+            report.start()
+            disk_cache = BrepCache.open(pref)
+
+            built: list[str] = []
+            entities: list[SvgEntity] = []
+            with shape_cache.read_only():
+                for obj in result.objects():
+                    if obj.path not in missing:
+                        continue
+                    report.objects += 1
+                    built.append(obj.path)
+                    digest = content_hash(obj)
+                    if entity := build_entity(obj, digest, report, disk_cache, build=True):
+                        entities.append(entity)
+
+            file_name = self.copy_database()
+            SvgDatabase(file_name).replace_many(built, entities)
+            self.store_database(file_name)
+            if disk_cache:
+                disk_cache.trim()
+            report.finish()
+            result.release()
+            self.import_report = report
+            ui.print_log(report.summary())
+
+    def copy_database(self) -> Path:
+        """Temporary copy of sql_file, the stored file is read only."""
+        file_name = Path(gettempdir()) / f"{uuid4()!s}.sqlite"
+        copyfile(self.sql_file, file_name)
+        return file_name
+
+    def store_database(self, file_name: Path) -> None:
+        """
+        Replace sql_file with a database file.
+
+        The property keeps its own copy and removes the previous one, so the
+        temporary file is removed too.
+        """
+        self.sql_file = str(file_name)
+        file_name.unlink(missing_ok=True)
+
+    def finish_import(
+        self,
+        file_name: Path,
+        report: ImportReport,
+        disk_cache: BrepCache | None,
+    ) -> None:
+        from ..vendor.fcapi import fcui as ui
+
+        if disk_cache:
+            disk_cache.trim()
+        self.store_database(file_name)
+        report.finish()
+        self.import_report = report
+        ui.print_log(report.summary())
+
+        if next(find_child_actions(self.Object), 0) == 0:
+            self.create_action()
 
     def on_execute(self, _) -> None:
         pass
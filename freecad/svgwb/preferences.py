@@ -103,14 +103,72 @@ class SvgImportPreferences(Preferences):
         ui_validators=[valid.min(6)],
     )
 
-    edge_approx_points = Preference(
+    # Former fixed sample count "edge_approx_points" is not read anymore,
+    # values stored with that meaning would cap the refinement too early
+    edge_approx_max_points = Preference(
         group,
-        name="edge_approx_points",
-        default=10,
-        label=dtr("SvgWB", "Discretization points"),
-        description=dtr("SvgWB", "Number of discretization points for approximated edges"),
+        name="edge_approx_max_points",
+        default=100,
+        label=dtr("SvgWB", "Maximum discretization points"),
+        description=dtr(
+            "SvgWB",
+            "Maximum number of discretization points for approximated edges, "
+            "fewer are used when the coordinate resolution allows",
+        ),
+        ui_section=dtr("SvgWB", "Geometry"),
+        ui_validators=[valid.min(10), valid.max(1000)],
+    )
+
+    merge_curves = Preference(
+        group,
+        name="merge_curves",
+        default=False,
+        label=dtr("SvgWB", "Merge smooth curves"),
+        description=dtr(
+            "SvgWB",
+            "Join consecutive tangent continuous bezier segments into a single bspline edge",
+        ),
         ui_section=dtr("SvgWB", "Geometry"),
-        ui_validators=[valid.min(10), valid.max(100)],
+    )
+
+    parser_backend = Preference(
+        group,
+        name="parser_backend",
+        default="sax",
+        label=dtr("SvgWB", "Xml parser"),
+        description=dtr("SvgWB", "Xml parser backend used to read svg files"),
+        options={
+            dtr("SvgWB", "xml.sax (defusedxml if available)"): "sax",
+            dtr("SvgWB", "Direct expat (faster)"): "expat",
+        },
+        ui_section=dtr("SvgWB", "Advanced"),
+    )
+
+    shape_cache_size = Preference(
+        group,
+        name="shape_cache_size",
+        default=512,
+        label=dtr("SvgWB", "Geometry cache size (MB)"),
+        description=dtr(
+            "SvgWB",
+            "Estimated memory budget of built geometry kept while importing, "
+            "it is released with the import",
+        ),
+        ui_section=dtr("SvgWB", "Advanced"),
+        ui_validators=[valid.min(0)],
+    )
+
+    brep_cache_size = Preference(
+        group,
+        name="brep_cache_size",
+        default=1024,
+        label=dtr("SvgWB", "Disk geometry cache size (MB)"),
+        description=dtr(
+            "SvgWB",
+            "Disk space used to reuse geometry of unchanged elements between syncs, 0 disables it",
+        ),
+        ui_section=dtr("SvgWB", "Advanced"),
+        ui_validators=[valid.min(0)],
     )
 
 
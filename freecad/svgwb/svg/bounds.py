@@ -0,0 +1,282 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Pure python bounding boxes of svg geometry (no OCC involved).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from FreeCAD import Matrix  # type: ignore
+
+# 2D affine transformation (a, b, c, d, e, f):
+#   x' = a*x + b*y + c
+#   y' = d*x + e*y + f
+Affine = tuple[float, float, float, float, float, float]
+
+IDENTITY: Affine = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+# Center parameterization of an arc: (cx, cy, rx, ry, theta1, delta)
+CenterArc = tuple[float, float, float, float, float, float]
+
+# Below this number of arcs numpy setup costs more than it saves
+NUMPY_MIN_ARCS = 8
+
+
+def affine(m: Matrix | None) -> Affine:
+    """Extract the xy affine part of a FreeCAD Matrix."""
+    if m is None:
+        return IDENTITY
+    return (m.A11, m.A12, m.A14, m.A21, m.A22, m.A24)
+
+
+@dataclass(slots=True)
+class Bounds:
+    """Axis aligned 2D bounding box."""
+
+    xmin: float = math.inf
+    ymin: float = math.inf
+    xmax: float = -math.inf
+    ymax: float = -math.inf
+
+    def __bool__(self) -> bool:
+        return self.xmin <= self.xmax and self.ymin <= self.ymax
+
+    @property
+    def center(self) -> tuple[float, float]:
+        return (self.xmin + self.xmax) / 2, (self.ymin + self.ymax) / 2
+
+    def add(self, x: float, y: float) -> None:
+        self.xmin = min(self.xmin, x)
+        self.xmax = max(self.xmax, x)
+        self.ymin = min(self.ymin, y)
+        self.ymax = max(self.ymax, y)
+
+    def moved(self, dx: float, dy: float) -> Bounds:
+        return Bounds(self.xmin + dx, self.ymin + dy, self.xmax + dx, self.ymax + dy)
+
+    def intersects(self, other: Bounds) -> bool:
+        return not (
+            other.xmin > self.xmax
+            or other.xmax < self.xmin
+            or other.ymin > self.ymax
+            or other.ymax < self.ymin
+        )
+
+    def contains(self, other: Bounds, tolerance: float = 0.0) -> bool:
+        return (
+            other.xmin >= self.xmin - tolerance
+            and other.xmax <= self.xmax + tolerance
+            and other.ymin >= self.ymin - tolerance
+            and other.ymax <= self.ymax + tolerance
+        )
+
+
+class BoundsBuilder:
+    """
+    Accumulate the exact bounds of points and curves under an affine transformation.
+
+    All input coordinates are in FreeCAD orientation (svg y axis already flipped).
+    """
+
+    def __init__(self, transform: Affine = IDENTITY) -> None:
+        self.transform = transform
+        self.bounds = Bounds()
+
+    def apply(self, x: float, y: float) -> tuple[float, float]:
+        a, b, c, d, e, f = self.transform
+        return a * x + b * y + c, d * x + e * y + f
+
+    def point(self, x: float, y: float) -> None:
+        self.bounds.add(*self.apply(x, y))
+
+    def points(self, coords: Iterable[tuple[float, float]]) -> None:
+        a, b, c, d, e, f = self.transform
+        add = self.bounds.add
+        for x, y in coords:
+            add(a * x + b * y + c, d * x + e * y + f)
+
+    def quadratic(self, p0: tuple, p1: tuple, p2: tuple) -> None:
+        q0, q1, q2 = self.apply(*p0), self.apply(*p1), self.apply(*p2)
+        self.bounds.add(*q0)
+        self.bounds.add(*q2)
+        for axis in (0, 1):
+            a, b, c = q0[axis], q1[axis], q2[axis]
+            den = a - 2 * b + c
+            if den != 0:
+                t = (a - b) / den
+                if 0 < t < 1:
+                    self.bounds.add(*_quadratic_at(q0, q1, q2, t))
+
+    def cubic(self, p0: tuple, p1: tuple, p2: tuple, p3: tuple) -> None:
+        q0, q1, q2, q3 = self.apply(*p0), self.apply(*p1), self.apply(*p2), self.apply(*p3)
+        self.bounds.add(*q0)
+        self.bounds.add(*q3)
+        for axis in (0, 1):
+            for t in _cubic_extrema(q0[axis], q1[axis], q2[axis], q3[axis]):
+                self.bounds.add(*_cubic_at(q0, q1, q2, q3, t))
+
+    def ellipse(
+        self,
+        center: tuple[float, float],
+        u: tuple[float, float],
+        v: tuple[float, float],
+        theta1: float = 0.0,
+        delta: float = math.tau,
+    ) -> None:
+        """
+        Add the elliptical arc: center + u*cos(t) + v*sin(t), t in [theta1, theta1 + delta].
+        """
+        a, b, _, d, e, _ = self.transform
+        cx, cy = self.apply(*center)
+        ux, uy = a * u[0] + b * u[1], d * u[0] + e * u[1]
+        vx, vy = a * v[0] + b * v[1], d * v[0] + e * v[1]
+        add = self.bounds.add
+
+        def at(t: float) -> tuple[float, float]:
+            cos_t, sin_t = math.cos(t), math.sin(t)
+            return cx + ux * cos_t + vx * sin_t, cy + uy * cos_t + vy * sin_t
+
+        add(*at(theta1))
+        add(*at(theta1 + delta))
+        lo, hi = min(theta1, theta1 + delta), max(theta1, theta1 + delta)
+        for base in (math.atan2(vx, ux), math.atan2(vy, uy)):
+            for extreme in (base, base + math.pi):
+                # Bring the candidate angle into [lo, lo + tau)
+                t = lo + (extreme - lo) % math.tau
+                if t <= hi:
+                    add(*at(t))
+
+
+def _quadratic_at(p0: tuple, p1: tuple, p2: tuple, t: float) -> tuple[float, float]:
+    s = 1 - t
+    return (
+        s * s * p0[0] + 2 * s * t * p1[0] + t * t * p2[0],
+        s * s * p0[1] + 2 * s * t * p1[1] + t * t * p2[1],
+    )
+
+
+def _cubic_at(p0: tuple, p1: tuple, p2: tuple, p3: tuple, t: float) -> tuple[float, float]:
+    s = 1 - t
+    k0, k1, k2, k3 = s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t
+    return (
+        k0 * p0[0] + k1 * p1[0] + k2 * p2[0] + k3 * p3[0],
+        k0 * p0[1] + k1 * p1[1] + k2 * p2[1] + k3 * p3[1],
+    )
+
+
+def _cubic_extrema(p0: float, p1: float, p2: float, p3: float) -> list[float]:
+    """Parameters in (0, 1) where the derivative of a 1D cubic bezier vanishes."""
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+    if abs(a) < 1e-12:  # noqa: PLR2004
+        roots = [-c / b] if b != 0 else []
+    else:
+        disc = b * b - 4 * a * c
+        if disc < 0:
+            return []
+        sq = math.sqrt(disc)
+        roots = [(-b + sq) / (2 * a), (-b - sq) / (2 * a)]
+    return [t for t in roots if 0 < t < 1]
+
+
+def arc_center(  # noqa: PLR0913
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    rx: float,
+    ry: float,
+    phi: float,
+    large_flag: bool,
+    sweep_flag: bool,
+) -> CenterArc | None:
+    """
+    Convert an svg arc from endpoint to center parameterization.
+
+    See https://www.w3.org/TR/SVG/implnote.html#ArcConversionEndpointToCenter
+    Coordinates are in svg orientation (y down), phi in radians.
+
+    Returns
+    -------
+    (cx, cy, rx, ry, theta1, delta) or None if the arc is degenerate.
+        Radii are corrected (scaled up) when too small to reach the end point.
+
+    """
+    if x1 == x2 and y1 == y2:
+        return None
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return None
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    hx, hy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_phi * hx + sin_phi * hy
+    y1p = -sin_phi * hx + cos_phi * hy
+    lam = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if lam > 1:
+        scale = math.sqrt(lam)
+        rx, ry = rx * scale, ry * scale
+    rx2, ry2 = rx * rx, ry * ry
+    den = rx2 * y1p * y1p + ry2 * x1p * x1p
+    coef = math.sqrt(max(0.0, (rx2 * ry2 - den) / den))
+    if large_flag == sweep_flag:
+        coef = -coef
+    cxp = coef * rx * y1p / ry
+    cyp = -coef * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+    ux, uy = (x1p - cxp) / rx, (y1p - cyp) / ry
+    vx, vy = (-x1p - cxp) / rx, (-y1p - cyp) / ry
+    theta1 = math.atan2(uy, ux)
+    delta = (math.atan2(vy, vx) - theta1) % math.tau
+    if not sweep_flag and delta > 0:
+        delta -= math.tau
+    return cx, cy, rx, ry, theta1, delta
+
+
+def arc_centers(arcs: Sequence[tuple[float, ...]]) -> list[CenterArc | None]:
+    """
+    Batch version of arc_center, vectorized with numpy when available.
+
+    Each row is (x1, y1, x2, y2, rx, ry, phi, large_flag, sweep_flag).
+    """
+    if np is None or len(arcs) < NUMPY_MIN_ARCS:
+        return [arc_center(*arc) for arc in arcs]
+    x1, y1, x2, y2, rx, ry, phi, large_flag, sweep_flag = np.array(arcs, dtype=float).T
+    rx, ry = np.abs(rx), np.abs(ry)
+    degenerate = ((x1 == x2) & (y1 == y2)) | (rx == 0) | (ry == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+        hx, hy = (x1 - x2) / 2, (y1 - y2) / 2
+        x1p = cos_phi * hx + sin_phi * hy
+        y1p = -sin_phi * hx + cos_phi * hy
+        lam = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+        scale = np.sqrt(np.maximum(lam, 1.0))
+        rx, ry = rx * scale, ry * scale
+        rx2, ry2 = rx * rx, ry * ry
+        den = rx2 * y1p * y1p + ry2 * x1p * x1p
+        coef = np.sqrt(np.maximum(0.0, (rx2 * ry2 - den) / den))
+        coef = np.where(large_flag == sweep_flag, -coef, coef)
+        cxp = coef * rx * y1p / ry
+        cyp = -coef * ry * x1p / rx
+        cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+        cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+        ux, uy = (x1p - cxp) / rx, (y1p - cyp) / ry
+        vx, vy = (-x1p - cxp) / rx, (-y1p - cyp) / ry
+        theta1 = np.arctan2(uy, ux)
+        delta = np.mod(np.arctan2(vy, vx) - theta1, math.tau)
+        delta = np.where((sweep_flag == 0) & (delta > 0), delta - math.tau, delta)
+    rows = np.column_stack((cx, cy, rx, ry, theta1, delta)).tolist()
+    return [None if bad else tuple(row) for row, bad in zip(rows, degenerate.tolist(), strict=True)]
@@ -0,0 +1,176 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Persistent content addressed cache of built geometry as BREP strings.
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+from dataclasses import fields
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import FreeCAD as App  # type: ignore
+
+from .geom import DraftPrecision
+from .shape import SvgShape
+
+if TYPE_CHECKING:
+    from ..preferences import SvgImportPreferences
+    from .object import SvgObject
+
+# Change when geometry construction changes, old entries are then ignored
+CACHE_VERSION = 1
+
+# Fields that do not affect geometry
+IGNORED_FIELDS = frozenset({"id", "label", "options", "index", "parent"})
+
+
+def cache_dir() -> Path:
+    return Path(App.getUserCachePath()) / "SvgWB" / "brep"
+
+
+def geometry_key(shape: SvgShape) -> str | None:
+    """
+    Hash of everything the geometry of a flattened object depends on.
+
+    Element attributes, accumulated transformation, style and the import
+    preferences stored in the shape (precision, discretization...). Unit
+    scaling is part of the transformation. None for objects without geometry.
+    """
+    if type(shape).to_shape is SvgShape.to_shape:
+        return None
+    parts: list[object] = [CACHE_VERSION, DraftPrecision, type(shape).__name__]
+    for field in fields(shape):
+        if field.name not in IGNORED_FIELDS:
+            value = getattr(shape, field.name)
+            parts.append(value.A if hasattr(value, "A") else value)
+    return sha256(repr(parts).encode()).hexdigest()
+
+
+def content_hash(obj: SvgObject) -> str:
+    """Hash of everything stored in the database row of a flattened object."""
+    shape = obj.shape
+    parts = (geometry_key(shape), obj.id, shape.tag, shape.label, obj.path, obj.href)
+    return sha256(repr(parts).encode()).hexdigest()
+
+
+class BrepCache:
+    """
+    BREP strings stored one per file, shared by all documents.
+
+    An empty string means that the object has no geometry. Files are touched
+    when read, trim removes the least recently used ones beyond max_bytes.
+    The total size is kept in an index file, so the entries are only listed
+    when the bytes written push the cache over max_bytes.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Bytes stored by put since the last trim. Overwritten entries are
+        # counted again, the indexed size may only be above the real one
+        self.written = 0
+
+    @classmethod
+    def open(cls, pref: SvgImportPreferences) -> BrepCache | None:
+        """Cache configured in preferences, None if disabled."""
+        max_bytes = pref.brep_cache_size() * 2**20
+        return cls(cache_dir(), max_bytes) if max_bytes > 0 else None
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.brep"
+
+    def get(self, key: str) -> str | None:
+        file = self.path(key)
+        try:
+            brep = file.read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        with suppress(OSError):
+            os.utime(file)
+        self.hits += 1
+        return brep
+
+    def put(self, key: str, brep: str) -> None:
+        file = self.path(key)
+        with suppress(OSError):
+            file.parent.mkdir(parents=True, exist_ok=True)
+            # Write and rename, readers never see partial files
+            tmp = file.with_suffix(f".{uuid4().hex}.tmp")
+            tmp.write_text(brep, encoding="utf-8")
+            tmp.replace(file)
+            self.written += len(brep)
+
+    def files(self) -> list[tuple[float, int, Path]]:
+        """(access time, size, path) of all entries, oldest first."""
+        entries = []
+        for file in self.root.glob("*/*.brep"):
+            with suppress(OSError):
+                stat = file.stat()
+                entries.append((stat.st_mtime, stat.st_size, file))
+        entries.sort()
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.files())
+
+    @property
+    def index(self) -> Path:
+        return self.root / "size"
+
+    def indexed_size(self) -> int | None:
+        """Total size recorded by the last trim, None if unknown."""
+        try:
+            return int(self.index.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def write_index(self, size: int) -> None:
+        with suppress(OSError):
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.index.with_suffix(f".{uuid4().hex}.tmp")
+            tmp.write_text(str(size), encoding="utf-8")
+            tmp.replace(self.index)
+
+    def trim(self) -> int:
+        """Remove least recently used entries beyond max_bytes, return removed bytes."""
+        written, self.written = self.written, 0
+        known = self.indexed_size()
+        if known is not None and known + written <= self.max_bytes:
+            if written:
+                self.write_index(known + written)
+            return 0
+        entries = self.files()
+        total = sum(size for _, size, _ in entries)
+        excess = total - self.max_bytes
+        removed = 0
+        for _, size, file in entries:
+            if removed >= excess:
+                break
+            with suppress(OSError):
+                file.unlink()
+                removed += size
+        self.write_index(total - removed)
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries, return removed bytes."""
+        removed = 0
+        for _, size, file in self.files():
+            with suppress(OSError):
+                file.unlink()
+                removed += size
+        for tmp in self.root.glob("*/*.tmp"):
+            with suppress(OSError):
+                tmp.unlink()
+        self.write_index(0)
+        return removed
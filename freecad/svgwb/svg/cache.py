@@ -3,29 +3,163 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from functools import cached_property, wraps  # noqa: F401
+from itertools import count
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from Part import Shape  # type: ignore
 
 CACHE_MISS = object()
 T = TypeVar("T")
 
+# Rough memory footprint of cached geometry, OCC does not report it
+ENTRY_BYTES = 256
+EDGE_BYTES = 1024
+FACE_BYTES = 4096
+
+DEFAULT_MAX_BYTES = 512 * 2**20
+
+
+@dataclass
+class CacheStats:
+    """Counters of the shape cache, bytes are estimated."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def reset(self) -> None:
+        """Reset the counters, entries and bytes still describe the cache content."""
+        self.hits = self.misses = self.evictions = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+            f"{self.entries} entries, ~{self.bytes / 2**20:.1f} MiB"
+        )
+
+
+def shape_size(value: Shape | list[Shape] | None) -> int:
+    """Estimated memory used by cached geometry."""
+    if value is None:
+        return ENTRY_BYTES
+    if isinstance(value, list):
+        return ENTRY_BYTES + sum(shape_size(shape) for shape in value)
+    return (
+        ENTRY_BYTES
+        + EDGE_BYTES * value.countSubElements("Edge")
+        + FACE_BYTES * value.countSubElements("Face")
+    )
+
+
+class ShapeCache:
+    """
+    Least recently used cache of built geometry, bounded by memory and entries.
+
+    Entries are keyed by owner object and method name, and cleared when the
+    parse result they belong to is released, see SvgParseResult.release.
+    By default hits return copies, in read only mode the cached shapes
+    themselves are returned.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.shared = False
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[int, str], tuple[object, int]] = OrderedDict()
+        self._tokens = count(1)
+
+    def key(self, owner: object, name: str) -> tuple[int, str]:
+        # Copies made with SvgShape.with_transform drop _cached_ attributes
+        token = getattr(owner, "_cached_key", None)
+        if token is None:
+            token = next(self._tokens)
+            owner._cached_key = token  # noqa: SLF001
+        return token, name
+
+    def get(self, key: tuple[int, str]) -> object:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return CACHE_MISS
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple[int, str], value: object) -> None:
+        size = shape_size(value)
+        self.discard(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.stats.entries += 1
+        self.stats.bytes += size
+        self.evict()
+
+    def discard(self, key: tuple[int, str]) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self.stats.entries -= 1
+            self.stats.bytes -= entry[1]
+
+    def evict(self) -> None:
+        stats = self.stats
+        while self._entries and (
+            stats.bytes > self.max_bytes
+            or (self.max_entries is not None and stats.entries > self.max_entries)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            stats.entries -= 1
+            stats.bytes -= size
+            stats.evictions += 1
+
+    def configure(self, max_bytes: int, max_entries: int | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for field in fields(self.stats):
+            setattr(self.stats, field.name, 0)
+
+    @contextmanager
+    def read_only(self) -> Generator[None, None, None]:
+        """Return cached shapes without copying them, callers must not modify them."""
+        shared, self.shared = self.shared, True
+        try:
+            yield
+        finally:
+            self.shared = shared
+
+
+shape_cache = ShapeCache()
+
 
 def cached_copy(fn: T) -> T:
     """Return a copy of the cached Shape."""
-    attr = f"_cached_{fn.__name__}"
+    name = fn.__name__
 
     @wraps(fn)
     def getter(self, *args, **kwargs) -> Shape | None:  # noqa: ANN001
-        cache = getattr(self, attr, CACHE_MISS)
+        if (base := getattr(self, "_base", None)) is not None:
+            # Instances place the geometry of their base, see SvgShape.placed
+            return self.place(getattr(base, name)(*args, **kwargs))
+        key = shape_cache.key(self, name)
+        cache = shape_cache.get(key)
         if cache is None:
             return None
         if cache is not CACHE_MISS:
-            return cache.copy()
+            return cache if shape_cache.shared else cache.copy()
         cache = fn(self, *args, **kwargs)
-        setattr(self, attr, cache)
+        shape_cache.put(key, cache)
         return cache
 
     return getter
@@ -33,17 +167,20 @@ def cached_copy(fn: T) -> T:
 
 def cached_copy_list(fn: T) -> T:
     """Return a list of copies of the cached Shapes."""
-    attr = f"_cached_{fn.__name__}"
+    name = fn.__name__
 
     @wraps(fn)
     def getter(self, *args, **kwargs) -> list[Shape]:  # noqa: ANN001
-        cache = getattr(self, attr, CACHE_MISS)
+        if (base := getattr(self, "_base", None)) is not None:
+            return [self.place(shape) for shape in getattr(base, name)(*args, **kwargs)]
+        key = shape_cache.key(self, name)
+        cache = shape_cache.get(key)
         if cache is None:
             return []
         if cache is not CACHE_MISS:
-            return [s.copy() for s in cache]
+            return list(cache) if shape_cache.shared else [s.copy() for s in cache]
         cache = fn(self, *args, **kwargs)
-        setattr(self, attr, cache)
-        return cache or []
+        shape_cache.put(key, cache)
+        return list(cache or [])
 
     return getter
@@ -8,7 +8,9 @@ from dataclasses import dataclass
 from FreeCAD import Vector  # type: ignore
 from Part import Shape, Wire, Face, makeCircle as make_circle  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, affine
 from .shape import SvgShape
+from .geom import transform_shape
 from .cache import cached_copy
 
 
@@ -28,4 +30,9 @@ class SvgCircle(SvgShape):
         if self.style.fill_color:
             sh = Face(Wire([sh]))
         sh.translate(Vector(self.cx, -self.cy, 0))
-        return sh.transformGeometry(self.transform)
+        return transform_shape(sh, self.transform)
+
+    def bounds(self) -> Bounds | None:
+        builder = BoundsBuilder(affine(self.transform))
+        builder.ellipse((self.cx, -self.cy), (self.r, 0.0), (0.0, self.r))
+        return builder.bounds
@@ -17,6 +17,9 @@ from Part import Shape  # type: ignore
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Iterable
 
+# Keep IN (...) lists below the SQLite host parameter limit
+MAX_PARAMS = 500
+
 
 @contextmanager
 def transaction(path: str | Path) -> Generator[Connection, None, None]:
@@ -60,6 +63,8 @@ class SvgEntity:
     path: str
     href: str | None = None
     brep: str | None = None
+    # Hash of the svg content of the row, see brep_cache.content_hash
+    content_hash: str | None = None
 
     @cached_property
     def shape(self) -> Shape:
@@ -83,7 +88,8 @@ class SvgDatabase:
                     label text,
                     path text not null primary key,
                     href text,
-                    brep text
+                    brep text,
+                    content_hash text
                 );
             """)
 
@@ -176,6 +182,48 @@ class SvgDatabase:
             """,  # nosec B608
         )
 
+    def find_by_paths(self, paths: list[str], include_brep: bool = True) -> list[SvgEntity]:
+        """Rows with exactly the given paths."""
+        brep = ", brep" if include_brep else ""
+        entities = []
+        for i in range(0, len(paths), MAX_PARAMS):
+            chunk = paths[i : i + MAX_PARAMS]
+            entities.extend(
+                self._query(
+                    f"""
+                    SELECT id, tag, label, path, href {brep}
+                    FROM objects
+                    WHERE path IN ({in_params(chunk)})
+                    """,  # nosec B608
+                    chunk,
+                ),
+            )
+        return entities
+
+    def has_content_hashes(self) -> bool:
+        """Databases created by older versions have no content_hash column."""
+        with connection(self.path) as con:
+            columns = con.execute("PRAGMA table_info(objects)")
+            return any(col[1] == "content_hash" for col in columns)
+
+    def content_hashes(self) -> dict[str, tuple[str | None, bool]]:
+        """Content hash and geometry availability of every row, by path."""
+        with connection(self.path) as con:
+            cursor = con.execute("SELECT path, content_hash, brep IS NOT NULL FROM objects")
+            return {path: (digest, bool(built)) for path, digest, built in cursor}
+
+    def replace_many(self, paths: list[str], entities: Iterable[SvgEntity]) -> None:
+        """Delete the rows with the given paths and add entities, in one transaction."""
+        with transaction(self.path) as con:
+            for i in range(0, len(paths), MAX_PARAMS):
+                chunk = paths[i : i + MAX_PARAMS]
+                con.execute(
+                    f"DELETE FROM objects WHERE path IN ({in_params(chunk)})",  # nosec B608
+                    chunk,
+                )
+            for e in entities:
+                self._add(e, con)
+
     def add(self, entity: SvgEntity) -> None:
         with transaction(self.path) as con:
             self._add(entity, con)
@@ -183,8 +231,8 @@ class SvgDatabase:
     def _add(self, entity: SvgEntity, con: Connection) -> None:
         con.execute(
             """
-            INSERT INTO objects (id, tag, label, path, href, brep)
-            VALUES (?,?,?,?,?,?)
+            INSERT INTO objects (id, tag, label, path, href, brep, content_hash)
+            VALUES (?,?,?,?,?,?,?)
             """,
             (
                 entity.id,
@@ -193,6 +241,7 @@ class SvgDatabase:
                 entity.path,
                 entity.href,
                 entity.brep,
+                entity.content_hash,
             ),
         )
 
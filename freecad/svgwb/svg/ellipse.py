@@ -8,7 +8,9 @@ from dataclasses import dataclass
 from FreeCAD import Vector  # type: ignore
 from Part import Shape, Wire, Face, Ellipse  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, affine
 from .shape import SvgShape
+from .geom import transform_shape
 from .cache import cached_copy
 
 
@@ -37,4 +39,11 @@ class SvgEllipse(SvgShape):
             sh.rotate(c, Vector(0, 0, 1), 90)
         if self.style.fill_color:
             sh = Face(Wire([sh]))
-        return sh.transformGeometry(self.transform)
+        return transform_shape(sh, self.transform)
+
+    def bounds(self) -> Bounds | None:
+        if self.rx < 0 or self.ry < 0:
+            return None
+        builder = BoundsBuilder(affine(self.transform))
+        builder.ellipse((self.cx, -self.cy), (self.rx, 0.0), (0.0, self.ry))
+        return builder.bounds
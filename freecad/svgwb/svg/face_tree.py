@@ -2,17 +2,36 @@
 # (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
 
 from __future__ import annotations
+
+import math
+from contextlib import suppress
+from functools import cached_property
+from itertools import count
 from typing import TYPE_CHECKING
 
+from Part import makeFace as make_face  # type: ignore
+
+from .bounds import Bounds
+
 if TYPE_CHECKING:
     from Part import Face  # type: ignore
 
+# Wire discretization deflection, relative to the face size
+RELATIVE_DEFLECTION = 1e-3
+
+# Faces spanning more grid cells than this are kept out of the grid
+MAX_GRID_CELLS = 64
+
+# Relative area mismatch accepted for faces built directly with holes
+AREA_TOLERANCE = 1e-6
+
 
 class FaceTreeNode:
     """
     Tree structure holding one-closed-wire faces sorted after each others enclosure.
 
     This class only works with faces that have exactly one closed wire
+    lying on the XY plane.
     """
 
     face: Face
@@ -24,6 +43,19 @@ class FaceTreeNode:
         self.face = face
         self.name = name
         self.children = []
+        self.index = FaceGrid()
+        if face:
+            bb = face.BoundBox
+            self.bounds = Bounds(bb.XMin, bb.YMin, bb.XMax, bb.YMax)
+            self.area = face.Area
+            size = max(bb.XLength, bb.YLength)
+            self.tolerance = max(size * RELATIVE_DEFLECTION, 1e-7)
+
+    @cached_property
+    def polygon(self) -> list[tuple[float, float]]:
+        """Points on the wire, no further than tolerance from it between them."""
+        points = self.face.Wires[0].discretize(Deflection=self.tolerance)
+        return [(p.x, p.y) for p in points]
 
     def insert(self, face: Face, name: str) -> None:
         """
@@ -39,60 +71,77 @@ class FaceTreeNode:
                face identifier
 
         """
-        new = None
-        inserted = False
-        for node in self.children:
-            if node.face.Area > face.Area:
+        self.insert_node(FaceTreeNode(face, name))
+
+    def insert_node(self, new: FaceTreeNode) -> None:
+        encompassed = []
+        # Only faces with overlapping bounds can enclose each other
+        for node in self.index.query(new.bounds):
+            if node.area > new.area:
                 # new face could be encompassed
-                if (
-                    face.distToShape(node.face)[0] == 0.0
-                    and face.Wires[0].distToShape(node.face.Wires[0])[0] != 0.0
-                ):
+                if encloses(node, new):
                     # it is encompassed - enter next tree layer
-                    node.insert(face, name)
-                    inserted = True
+                    node.insert_node(new)
+                    return
             # new face could encompass
-            elif (
-                node.face.distToShape(face)[0] == 0.0
-                and node.face.Wires[0].distToShape(face.Wires[0])[0] != 0.0
-            ):
-                # it does encompass the current child nodes face
-                # create new node from face
-                if not new:
-                    new = FaceTreeNode(face, name)
-                # swap the new one with the child node
-                self.children.remove(node)
-                self.children.append(new)
-                # add former child node as child to the new node
-                new.children.append(node)
-        if not new and not inserted:
-            # the face is not encompassing and is not encompassed
-            # (from) any other face, we add it as new child
-            new = FaceTreeNode(face, name)
-            self.children.append(new)
-
-    def make_cuts(self) -> None:
+            elif encloses(new, node):
+                encompassed.append(node)
+
+        for node in encompassed:
+            # add former child node as child to the new node
+            self.children.remove(node)
+            self.index.remove(node)
+            new.children.append(node)
+            new.index.add(node)
+        self.children.append(new)
+        self.index.add(new)
+
+    def make_cuts(self, *, direct: bool = True) -> None:
         """
         Recursively traverse the tree and cuts all faces in even
         numbered tree levels with their direct children faces.
 
         Additionally the tree is shrunk by removing the odd numbered
         tree levels.
+
+        If direct is True, faces are built at once from their wire and the
+        wires of their children. Boolean cuts are used only if that is not
+        possible (children may overlap).
         """  # noqa: D205
         result = self.face
         if not result:
             for node in self.children:
-                node.make_cuts()
+                node.make_cuts(direct=direct)
         else:
             new_children = []
+            if self.children:
+                result = (direct and self.make_holed_face()) or self.cut_holes()
             for node in self.children:
-                result = result.cut(node.face)
                 for subnode in node.children:
-                    subnode.make_cuts()
+                    subnode.make_cuts(direct=direct)
                     new_children.append(subnode)
             self.children = new_children
             self.face = result
 
+    def make_holed_face(self) -> Face | None:
+        """Build the face with all children as holes, None if not possible."""
+        if any(len(self.index.query(node.bounds)) > 1 for node in self.children):
+            # Bounds of some children overlap, their wires may cross
+            return None
+        wires = [self.face.OuterWire, *(node.face.OuterWire for node in self.children)]
+        expected = self.area - sum(node.area for node in self.children)
+        with suppress(Exception):
+            face = make_face(wires, "Part::FaceMakerBullseye")
+            if face.isValid() and abs(face.Area - expected) <= AREA_TOLERANCE * self.area:
+                return face
+        return None
+
+    def cut_holes(self) -> Face:
+        result = self.face
+        for node in self.children:
+            result = result.cut(node.face)
+        return result
+
     def flatten(self) -> list[Face]:
         """Create a flattened list of face-name tuples from the FaceTree."""
         result = []
@@ -101,3 +150,192 @@ class FaceTreeNode:
         for node in self.children:
             result.extend(node.flatten())
         return result
+
+
+def encloses(outer: FaceTreeNode, inner: FaceTreeNode) -> bool:
+    """
+    Check if inner lies inside outer without touching its boundary.
+
+    Decided with bounding boxes, point in polygon and segment distance tests,
+    OCC distances are only used when the wires are too close to decide.
+    """
+    tolerance = 2 * outer.tolerance
+    if not outer.bounds.contains(inner.bounds, tolerance):
+        return False
+    polygon = outer.polygon
+    segments = near_segments(polygon, inner.bounds, tolerance)
+    if not segments:
+        # The boundary of outer stays away from inner: all of inner is on the same side
+        return locate_point(polygon, *inner.bounds.center, 0.0) > 0
+    ambiguous = False
+    for x, y in inner.polygon:
+        location = locate_point(polygon, x, y, tolerance)
+        if location < 0:
+            # At least one point is outside: disjoint or crossing wires
+            return False
+        ambiguous = ambiguous or location == 0
+    # Edges of outer may also cut through inner edges between their points
+    if not ambiguous and not polygons_near(segments, inner.polygon, tolerance):
+        return True
+    return (
+        inner.face.distToShape(outer.face)[0] == 0.0
+        and inner.face.Wires[0].distToShape(outer.face.Wires[0])[0] != 0.0
+    )
+
+
+Segment = tuple[float, float, float, float]  # Typing
+
+
+def near_segments(polygon: list[tuple[float, float]], b: Bounds, tol: float) -> list[Segment]:
+    """Polygon segments that may pass within tol of the box."""
+    xmin, ymin, xmax, ymax = b.xmin - tol, b.ymin - tol, b.xmax + tol, b.ymax + tol
+    segments = []
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        if not (
+            (x1 < xmin and x2 < xmin)
+            or (x1 > xmax and x2 > xmax)
+            or (y1 < ymin and y2 < ymin)
+            or (y1 > ymax and y2 > ymax)
+        ):
+            segments.append((x1, y1, x2, y2))
+        x1, y1 = x2, y2
+    return segments
+
+
+def polygons_near(segments: list[Segment], polygon: list[tuple[float, float]], tol: float) -> bool:
+    """Check if any of the segments crosses, or passes within tol of, the polygon."""
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        bx0, bx1 = min(x1, x2) - tol, max(x1, x2) + tol
+        by0, by1 = min(y1, y2) - tol, max(y1, y2) + tol
+        for s in segments:
+            if (
+                max(s[0], s[2]) >= bx0
+                and min(s[0], s[2]) <= bx1
+                and max(s[1], s[3]) >= by0
+                and min(s[1], s[3]) <= by1
+                and segment_distance(s, (x1, y1, x2, y2)) <= tol
+            ):
+                return True
+        x1, y1 = x2, y2
+    return False
+
+
+def segment_distance(a: Segment, b: Segment) -> float:
+    """Distance between two segments, 0 if they cross."""
+    ax, ay, bx, by = a
+    cx, cy, dx, dy = b
+    d1 = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    d2 = (bx - ax) * (dy - ay) - (by - ay) * (dx - ax)
+    d3 = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+    d4 = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+    if ((d1 > 0) != (d2 > 0)) and ((d3 > 0) != (d4 > 0)):
+        return 0.0
+    return min(
+        point_segment_distance(ax, ay, b),
+        point_segment_distance(bx, by, b),
+        point_segment_distance(cx, cy, a),
+        point_segment_distance(dx, dy, a),
+    )
+
+
+def point_segment_distance(px: float, py: float, s: Segment) -> float:
+    x1, y1, x2, y2 = s
+    dx, dy = x2 - x1, y2 - y1
+    len2 = dx * dx + dy * dy
+    t = ((px - x1) * dx + (py - y1) * dy) / len2 if len2 else 0.0
+    t = min(max(t, 0.0), 1.0)
+    return math.hypot(x1 + t * dx - px, y1 + t * dy - py)
+
+
+def locate_point(polygon: list[tuple[float, float]], px: float, py: float, tol: float) -> int:
+    """Return 1 if the point is inside the polygon, -1 if outside, 0 if near the boundary."""
+    inside = False
+    tol2 = tol * tol
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        dx, dy = x2 - x1, y2 - y1
+        len2 = dx * dx + dy * dy
+        t = ((px - x1) * dx + (py - y1) * dy) / len2 if len2 else 0.0
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        ex, ey = x1 + t * dx - px, y1 + t * dy - py
+        if ex * ex + ey * ey <= tol2:
+            return 0
+        if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * dx / dy:
+            inside = not inside
+        x1, y1 = x2, y2
+    return 1 if inside else -1
+
+
+class FaceGrid:
+    """
+    Uniform grid spatial index of tree nodes by bounds.
+
+    The cell size follows the smallest node seen, nodes spanning too many
+    cells are kept in a separate list that is always returned.
+    """
+
+    def __init__(self) -> None:
+        self.cell = 0.0
+        self.cells: dict[tuple[int, int], list[FaceTreeNode]] = {}
+        self.large: list[FaceTreeNode] = []
+        self.nodes: dict[int, tuple[int, FaceTreeNode]] = {}
+        self.seq = count()
+
+    def keys(self, b: Bounds) -> list[tuple[int, int]] | None:
+        cell = self.cell
+        x0, x1 = math.floor(b.xmin / cell), math.floor(b.xmax / cell)
+        y0, y1 = math.floor(b.ymin / cell), math.floor(b.ymax / cell)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_GRID_CELLS:
+            return None
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def add(self, node: FaceTreeNode) -> None:
+        b = node.bounds
+        size = max(b.xmax - b.xmin, b.ymax - b.ymin)
+        self.nodes[id(node)] = (next(self.seq), node)
+        if size > 0 and (not self.cell or size < self.cell / 4):
+            self.rebuild(2 * size)
+        else:
+            self.place(node)
+
+    def place(self, node: FaceTreeNode) -> None:
+        if not self.cell or (keys := self.keys(node.bounds)) is None:
+            self.large.append(node)
+            return
+        for key in keys:
+            self.cells.setdefault(key, []).append(node)
+
+    def rebuild(self, cell: float) -> None:
+        self.cell = cell
+        self.cells = {}
+        self.large = []
+        for _, node in self.nodes.values():
+            self.place(node)
+
+    def remove(self, node: FaceTreeNode) -> None:
+        del self.nodes[id(node)]
+        if node in self.large:
+            self.large.remove(node)
+            return
+        for key in self.keys(node.bounds):
+            self.cells[key].remove(node)
+
+    def query(self, b: Bounds) -> list[FaceTreeNode]:
+        """Nodes whose bounds intersect b, in insertion order."""
+        found = {id(node): node for node in self.large}
+        if self.cell:
+            keys = self.keys(b)
+            if keys is None:
+                # Query larger than the grid allows, check everything
+                return [node for _, node in self.nodes.values() if node.bounds.intersects(b)]
+            for key in keys:
+                for node in self.cells.get(key, ()):
+                    found[id(node)] = node
+        nodes = self.nodes
+        candidates = [nodes[key] for key in found if nodes[key][1].bounds.intersects(b)]
+        return [node for _, node in sorted(candidates, key=lambda item: item[0])]
@@ -1,19 +1,40 @@
 # SPDX-License: LGPL-2.1-or-later
 # (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
 
-from DraftVecUtils import angle as angle_between_vectors  # type: ignore
 from FreeCAD import Vector, Matrix  # type: ignore
 
 import math
+from dataclasses import dataclass, fields
 
 from Draft import precision as draft_precision  # type: ignore
-from Part import OCCError, Wire, Edge, Compound  # type: ignore
+from Part import OCCError, Wire, Edge, Compound, Shape  # type: ignore
 from Part import __sortEdges__ as sort_edges  # type: ignore
 
 # draft precision for calculations
 DraftPrecision = draft_precision()
 
 
+@dataclass
+class WireStats:
+    """How often each make_wire strategy was used."""
+
+    direct: int = 0  # Edges already ordered, wire built as is
+    sorted: int = 0  # Edges had to be sorted
+    connected: int = 0  # connectEdgesToWires fallback
+    failed: int = 0  # No single wire, compound of edges returned
+
+    @property
+    def fallbacks(self) -> int:
+        return self.connected + self.failed
+
+    def reset(self) -> None:
+        for field in fields(self):
+            setattr(self, field.name, 0)
+
+
+wire_stats = WireStats()
+
+
 def precision_step(precision: int = DraftPrecision) -> float:
     """
     Return the smallest possible fraction or step size for a given precision.
@@ -35,114 +56,39 @@ def precision_step(precision: int = DraftPrecision) -> float:
     return 10 ** (-precision)
 
 
-def arc_end_to_center(
-    last_v: Vector,
-    current_v: Vector,
-    rx: float,
-    ry: float,
-    x_rotation: float = 0.0,
-    correction: bool = False,
-) -> tuple[list[tuple[Vector, float, float]], tuple[float, float]]:
+def conformal_matrix(m: Matrix, tol: float = 1e-9) -> Matrix | None:
     """
-    Calculate the possible centers for an arc in endpoint parameterization.
-
-    Calculate (positive and negative) possible centers for an arc given in
-    ``endpoint parametrization``.
-    See http://www.w3.org/TR/SVG/implnote.html#ArcImplementationNotes
-
-    the sweep_flag is interpreted as: sweep_flag <==>  arc is traveled clockwise
-
-    Parameters
-    ----------
-    last_v : Base::Vector3
-        First point of the arc.
-    current_v : Base::Vector3
-        End point (current) of the arc.
-    rx : float
-        Radius of the ellipse, semi-major axis in the X direction.
-    ry : float
-        Radius of the ellipse, semi-minor axis in the Y direction.
-    x_rotation : float, optional
-        Default is 0. Rotation around the Z axis, in radians (CCW).
-    correction : bool, optional
-        Default is `False`. If it is `True`, the radii will be scaled
-        by a factor.
+    Return m as a 3D similarity if it is conformal in the XY plane, else None.
 
-    Returns
-    -------
-    list, (float, float)
-        A tuple that consists of one list, and a tuple of radii.
-    [(positive), (negative)], (rx, ry)
-        The first element of the list is the positive tuple,
-        the second is the negative tuple.
-    [(Base::Vector3, float, float),
-    (Base::Vector3, float, float)], (float, float)
-        Types
-    [(v_center+, angle1+, angle_delta+),
-    (v_center-, angle1-, angle_delta-)], (rx, ry)
-        The first element of the list is the positive tuple,
-        consisting of center, angle, and angle increment;
-        the second element is the negative tuple.
+    Conformal: rotation, reflection, translation and uniform scale, no shear.
+    The z scale is set to the xy scale so that OCC accepts it as a similarity,
+    it does not change shapes lying on the XY plane.
+    """
+    a, b, d, e = m.A11, m.A12, m.A21, m.A22
+    s2 = a * a + d * d
+    if s2 == 0:
+        return None
+    if abs(a * b + d * e) > tol * s2 or abs(b * b + e * e - s2) > tol * s2:
+        return None
+    if m.A13 or m.A23 or m.A31 or m.A32 or m.A41 or m.A42 or m.A43 or m.A44 != 1:
+        return None
+    similarity = Matrix(m)
+    similarity.A33 = math.sqrt(s2)
+    return similarity
+
+
+def transform_shape(shape: Shape, m: Matrix) -> Shape:
+    """
+    Apply a transformation to a shape lying on the XY plane.
 
+    Conformal matrices keep analytic geometry (lines, circles, arcs...),
+    other matrices convert it with transformGeometry.
     """
-    # scale_fact_sign = 1 if (large_flag != sweep_flag) else -1
-    rx = float(rx)
-    ry = float(ry)
-    v0 = last_v.sub(current_v)
-    v0.multiply(0.5)
-    m1 = Matrix()
-    m1.rotateZ(-x_rotation)  # eq. 5.1
-    v1 = m1.multiply(v0)
-    if correction:
-        e_param = v1.x**2 / rx**2 + v1.y**2 / ry**2
-        if e_param > 1:
-            ep_root = math.sqrt(e_param)
-            rx = ep_root * rx
-            ry = ep_root * ry
-    denom = rx**2 * v1.y**2 + ry**2 * v1.x**2
-    numer = rx**2 * ry**2 - denom
-    results = []
-
-    # If the division is very small, set the scaling factor to zero,
-    # otherwise try to calculate it by taking the square root
-    if abs(numer / denom) < precision_step(DraftPrecision):
-        scale_fact_pos = 0
-    else:
-        try:
-            scale_fact_pos = math.sqrt(numer / denom)
-        except ValueError:
-            scale_fact_pos = 0
-
-    # Calculate two values because the square root may be positive or negative
-    for scale_fact_sign in (1, -1):
-        scale_fact = scale_fact_pos * scale_fact_sign
-        # Step2 eq. 5.2
-        vcx1 = Vector(v1.y * rx / ry, -v1.x * ry / rx, 0).multiply(scale_fact)
-        m2 = Matrix()
-        m2.rotateZ(x_rotation)
-        center_off = current_v.add(last_v)
-        center_off.multiply(0.5)
-        v_center = m2.multiply(vcx1).add(center_off)  # Step3 eq. 5.3
-        # angle1 = Vector(1, 0, 0).getAngle(Vector((v1.x - vcx1.x)/rx,
-        #                                          (v1.y - vcx1.y)/ry,
-        #                                          0))  # eq. 5.5
-        # angle_delta = Vector((v1.x - vcx1.x)/rx,
-        #                     (v1.y - vcx1.y)/ry,
-        #                     0).getAngle(Vector((-v1.x - vcx1.x)/rx,
-        #                                        (-v1.y - vcx1.y)/ry,
-        #                                        0))  # eq. 5.6
-        # we need the right sign for the angle
-        angle1 = angle_between_vectors(
-            Vector(1, 0, 0),
-            Vector((v1.x - vcx1.x) / rx, (v1.y - vcx1.y) / ry, 0),
-        )  # eq. 5.5
-        angle_delta = angle_between_vectors(
-            Vector((v1.x - vcx1.x) / rx, (v1.y - vcx1.y) / ry, 0),
-            Vector((-v1.x - vcx1.x) / rx, (-v1.y - vcx1.y) / ry, 0),
-        )  # eq. 5.6
-        results.append((v_center, angle1, angle_delta))
-
-    return results, (rx, ry)
+    if m.isUnity():
+        return shape
+    if (similarity := conformal_matrix(m)) is not None:
+        return shape.transformed(similarity)
+    return shape.transformGeometry(m)
 
 
 def make_wire(
@@ -179,15 +125,19 @@ def make_wire(
 
     """
     if not dont_try:
+        if (sh := make_chained_wire(path, precision, check_closed)) is not None:
+            wire_stats.direct += 1
+            return sh
         try:
             sh = Wire(sort_edges(path))
-            # sh = Wire(path)
             isok = (not check_closed) or sh.isClosed()
             if len(sh.Edges) != len(path):
                 isok = False
         # BRep_API: command not done
         except OCCError:
             isok = False
+        if isok:
+            wire_stats.sorted += 1
     if dont_try or not isok:
         # Code from wmayer forum p15549 to fix the tolerance problem
         # original tolerance = 0.00001
@@ -196,9 +146,42 @@ def make_wire(
         sh = _sh.Wires[0]
         if len(sh.Edges) != len(path):
             sh = comp
+            wire_stats.failed += 1
+        else:
+            wire_stats.connected += 1
     return sh
 
 
+def make_chained_wire(path: list[Edge], precision: int, check_closed: bool) -> Wire | None:
+    """
+    Build a wire from edges that are already ordered end to start.
+
+    Returns None if the edges are not contiguous or the result is not
+    what the fallbacks of make_wire would produce.
+    """
+    if not path:
+        return None
+    tol = precision_step(precision)
+    first = path[0].firstVertex(True).Point
+    last = path[0].lastVertex(True).Point
+    for edge in path[1:]:
+        if not last.isEqual(edge.firstVertex(True).Point, tol):
+            return None
+        last = edge.lastVertex(True).Point
+    # An open chain is what connectEdgesToWires would build anyway,
+    # unless its ends touch and could be joined
+    ends_touch = first.isEqual(last, tol)
+    try:
+        sh = Wire(path)
+    except OCCError:
+        return None
+    if len(sh.Edges) != len(path):
+        return None
+    if sh.isClosed() or not check_closed or not ends_touch:
+        return sh
+    return None
+
+
 def equals(u: Vector, v: Vector, precision: int = -1) -> bool:
     """
     Return False if each delta of the two vectors components is zero.
@@ -8,8 +8,13 @@ from Part import Shape  # type: ignore
 from Part import makeCompound as make_compound  # type: ignore
 from .shape import SvgShape
 from .cache import cached_copy, cached_copy_list, cached_property
-from .object import SvgObject
-from copy import copy
+from .object import SvgObject, build_shapes
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from FreeCAD import Matrix  # type: ignore
+
 
 @dataclass
 class SvgGroup(SvgShape):
@@ -21,20 +26,12 @@ class SvgGroup(SvgShape):
     def to_shape(self) -> Shape | None:
         shapes = self.shapes()
         if shapes:
-            return make_compound(self.shapes())
+            return make_compound(shapes)
         return None
 
     @cached_copy_list
     def shapes(self) -> list[Shape]:
-        shapes: list[Shape] = []
-        for s in self._children:
-            if hasattr(s, "shapes"):
-                shapes.extend(s.shapes())
-            else:
-                shape = s.to_shape()
-                if shape:
-                    shapes.append(shape)
-        return [s.transformGeometry(self.transform) for s in shapes if s]
+        return build_shapes(self.objects)
 
     def append(self, shape: SvgShape) -> None:
         self._children.append(shape)
@@ -42,16 +39,33 @@ class SvgGroup(SvgShape):
     @cached_property
     def objects(self) -> list[SvgObject]:
         objects: list[SvgObject] = []
-        parent_id = self.id
+        self.collect_objects(self.transform, self.id, objects)
+        return objects
+
+    def collect_objects(
+        self,
+        ctm: Matrix,
+        path: str,
+        objects: list[SvgObject],
+        may_contain: Callable[[str], bool] | None = None,
+    ) -> None:
+        """
+        Walk the subtree accumulating the transformation top-down.
+
+        Each node costs one matrix multiply, instead of one per nesting
+        level for every descendant. Child groups rejected by `may_contain`
+        are skipped entirely.
+        """
         for child in self._children:
-            s = copy(child)
-            if hasattr(s, "objects"):
-                for obj in s.objects:
-                    obj.path = f"{parent_id}/{obj.path}"
-                    obj.shape.transform = self.transform * obj.shape.transform
-                    objects.append(obj)
+            if isinstance(child, SvgGroup):
+                child_path = f"{path}/{child.id}"
+                if may_contain and not may_contain(child_path):
+                    continue
+                child.collect_objects(ctm * child.transform, child_path, objects, may_contain)
+            elif hasattr(child, "objects"):
+                for obj in child.objects:
+                    s = obj.shape.with_transform(ctm * obj.shape.transform)
+                    objects.append(SvgObject(obj.id, f"{path}/{obj.path}", s, obj.href))
             else:
-                obj = SvgObject(s.id, f"{parent_id}/{s.id}", s)
-                obj.shape.transform = self.transform * obj.shape.transform
-                objects.append(obj)
-        return objects
+                s = child.with_transform(ctm * child.transform)
+                objects.append(SvgObject(s.id, f"{path}/{s.id}", s))
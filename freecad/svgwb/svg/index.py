@@ -1,23 +1,43 @@
 # SPDX-License: LGPL-2.1-or-later
 # (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
 
-from collections.abc import Iterator
-from .shape import SvgShape
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from .parser import SvgTemplate
+    from .shape import SvgShape
 
 
 class SvgIndex:
-    """In Memory index of all shapes parsed from an svg."""
+    """
+    In Memory index of all shapes parsed from an svg.
+
+    Ids inside <defs> and <symbol> map to templates, their shapes are
+    created the first time one of them is found.
+    """
 
     _data: dict[str, SvgShape]
+    _templates: dict[str, SvgTemplate]
 
     def __init__(self) -> None:
         self._data = {}
+        self._templates = {}
 
     def add(self, shape: SvgShape) -> None:
         self._data[shape.id] = shape
 
+    def add_template(self, id: str, template: SvgTemplate) -> None:  # noqa: A002
+        self._templates[id] = template
+
     def find(self, id: str) -> SvgShape | None:  # noqa: A002
-        return self._data.get(id)
+        shape = self._data.get(id)
+        if shape is None and (template := self._templates.pop(id, None)):
+            template.materialize()
+            shape = self._data.get(id)
+        return shape
 
     def __repr__(self) -> str:
         return str(list(self._data.keys()))
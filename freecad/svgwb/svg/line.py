@@ -8,7 +8,9 @@ from dataclasses import dataclass
 from FreeCAD import Vector  # type: ignore
 from Part import Shape, LineSegment  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, affine
 from .shape import SvgShape
+from .geom import transform_shape
 from .cache import cached_copy
 
 
@@ -26,4 +28,9 @@ class SvgLine(SvgShape):
         p1 = Vector(self.x1, -self.y1, 0)
         p2 = Vector(self.x2, -self.y2, 0)
         sh = LineSegment(p1, p2).toShape()
-        return sh.transformGeometry(self.transform)
+        return transform_shape(sh, self.transform)
+
+    def bounds(self) -> Bounds | None:
+        builder = BoundsBuilder(affine(self.transform))
+        builder.points(((self.x1, -self.y1), (self.x2, -self.y2)))
+        return builder.bounds
@@ -1,9 +1,15 @@
 # SPDX-License: LGPL-2.1-or-later
 # (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from .shape import SvgShape
+if TYPE_CHECKING:
+    from Part import Shape  # type: ignore
+    from .bounds import Bounds
+    from .shape import SvgShape
 
 
 @dataclass
@@ -14,3 +20,31 @@ class SvgObject:
     path: str
     shape: SvgShape
     href: str | None = None
+
+
+@dataclass
+class SvgObjectInfo:
+    """Metadata of an svg object, available without building geometry."""
+
+    id: str
+    tag: str
+    label: str
+    path: str
+    href: str | None = None
+    bounds: Bounds | None = None
+
+
+def build_shapes(objects: list[SvgObject]) -> list[Shape]:
+    """
+    Build the geometry of flattened objects.
+
+    Objects carry the composed transformation of all their ancestors,
+    so each leaf is transformed exactly once.
+    """
+    shapes: list[Shape] = []
+    for obj in objects:
+        if hasattr(obj.shape, "shapes"):
+            shapes.extend(obj.shape.shapes())
+        elif shape := obj.shape.to_shape():
+            shapes.append(shape)
+    return shapes
@@ -5,14 +5,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, astuple
-from functools import reduce
-from io import BytesIO
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 from hashlib import md5
 
 from xml import sax # nosec B406: parsing will be from defusedxml if available
+from xml.parsers import expat  # nosec B407: entities are forbidden in parse_expat
 
 try:
     from defusedxml.sax import make_parser
@@ -20,9 +20,10 @@ except ImportError:
     from xml.sax import make_parser  # nosec B406: parsing will be from defusedxml if available
 
 from .text import SvgText
-from .style import SvgColor, SvgStyle
+from .style import SvgStyle, SvgStyleCache
 from .options import SvgOptions
 from .group import SvgGroup, SvgObject
+from .object import SvgObjectInfo
 from .use import SvgUse
 from .line import SvgLine
 from .rect import SvgRect
@@ -32,14 +33,19 @@ from .polyline import SvgPolyLine
 from .ellipse import SvgEllipse
 from .circle import SvgCircle
 from .dimension import SvgDimension
+from .cache import shape_cache
 from . import parsers
 
 from FreeCAD import Matrix  # type: ignore
 
 if TYPE_CHECKING:
     from ..preferences import SvgImportPreferences
+    from .query import SvgQuery
     from .shape import SvgShape
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
 
 
 @dataclass
@@ -53,6 +59,91 @@ class StackFrame:
 
 
 Attrs = dict[str, str]  # Typing
+Event = tuple["str | None", "Attrs | str | None"]  # Typing
+Dispatch = dict[str, tuple[str, "Callable[..., None]"]]  # Typing
+
+# ContentHandler's own callbacks (startElement, endDocument, ...) are not element handlers
+_SAX_METHODS = frozenset(dir(sax.ContentHandler))
+
+# Elements whose content is never rendered, see startMarker
+_MUTED_TAGS = frozenset({"marker"})
+
+
+def element_dispatch(cls: type, kind: str) -> Dispatch:
+    """
+    Collect the element handlers of kind 'start' or 'end' from a handler class.
+
+    A method named f"{kind}Tag" handles the element <tag>. The table maps the raw tag,
+    and its 'svg:' qualified form, to the local tag name and the unbound method.
+    """
+    table: Dispatch = {}
+    for name in dir(cls):
+        if not name.startswith(kind) or name in _SAX_METHODS:
+            continue
+        suffix = name[len(kind) :]
+        if not suffix or suffix != suffix.capitalize():
+            continue
+        tag = suffix.lower()
+        entry = (tag, getattr(cls, name))
+        table[tag] = entry
+        table[f"svg:{tag}"] = entry
+    return table
+
+
+@cache
+def dispatch_tables(cls: type) -> tuple[Dispatch, Dispatch]:
+    """Build start/end element dispatch tables once per handler class."""
+    return element_dispatch(cls, "start"), element_dispatch(cls, "end")
+
+
+@dataclass
+class SvgTemplate:
+    """
+    Recorded xml events of a <symbol>, or of an element inside <defs>.
+
+    They are only rendered through <use>, so their shapes are created when
+    the index first resolves one of the ids inside, by replaying the events
+    in the context (style, transform) where they were found.
+    """
+
+    handler: SvgContentHandler
+    frame: StackFrame
+    count: int
+    events: list[Event] = field(default_factory=list)
+    depth: int = 0
+    materialized: bool = False
+
+    def start(self, tag: str, attrs: Attrs) -> None:
+        self.events.append((tag, attrs))
+        self.depth += 1
+
+    def end(self, tag: str) -> bool:
+        """Record an end tag, return True when the template is complete."""
+        self.events.append((tag, None))
+        self.depth -= 1
+        return self.depth == 0
+
+    def characters(self, content: str) -> None:
+        self.events.append((None, content))
+
+    def materialize(self) -> None:
+        if self.materialized:
+            return
+        self.materialized = True
+        h = self.handler
+        state = h.stack, h.count, h.muted, h.root, h.template, h.in_defs, h.replaying
+        h.stack, h.count, h.muted = [self.frame], self.count, []
+        h.template, h.in_defs, h.replaying = None, False, True
+        try:
+            for tag, value in self.events:
+                if tag is None:
+                    h.characters(value)
+                elif value is None:
+                    h.endElement(tag)
+                else:
+                    h.startElement(tag, value)
+        finally:
+            h.stack, h.count, h.muted, h.root, h.template, h.in_defs, h.replaying = state
 
 
 class SvgContentHandler(sax.ContentHandler):
@@ -65,18 +156,40 @@ class SvgContentHandler(sax.ContentHandler):
         self.stack: list[StackFrame] = []
         self.dpi = dpi_fallback
         self.count = 0
-        self.default_style = SvgStyle(
-            stroke_color=SvgColor(preferences.line_color()),
+        self.styles = SvgStyleCache()
+        self.default_style = self.styles.style(
+            stroke_color=preferences.line_color(),
             stroke_width=preferences.line_width(),
-            fill_color=SvgColor(preferences.fill_color()),
+            fill_color=preferences.fill_color(),
             font_size=preferences.font_size(),
         )
         self.disable_unit_scaling = preferences.disable_unit_scaling()
         self.root: SvgGroup = None
         self.index = SvgIndex()
         self.muted = []
-        self.discretization = preferences.edge_approx_points()
+        self.template: SvgTemplate | None = None
+        self.in_defs = False
+        self.replaying = False
+        self.discretization = preferences.edge_approx_max_points()
         self.precision = preferences.precision()
+        self.merge_curves = preferences.merge_curves()
+        self.start_dispatch, self.end_dispatch = dispatch_tables(type(self))
+
+    def bind_namespaces(self, attrs: Attrs) -> None:
+        """Register dispatch entries for any custom prefix bound to the svg namespace."""
+        prefixes = [
+            name.removeprefix("xmlns:")
+            for name, uri in attrs.items()
+            if uri == SVG_NAMESPACE and name.startswith("xmlns:") and name != "xmlns:svg"
+        ]
+        if not prefixes:
+            return
+        start, end = dict(self.start_dispatch), dict(self.end_dispatch)
+        for table in (start, end):
+            local = [(tag, entry) for tag, entry in table.items() if ":" not in tag]
+            for prefix in prefixes:
+                table.update((f"{prefix}:{tag}", entry) for tag, entry in local)
+        self.start_dispatch, self.end_dispatch = start, end
 
     def get_id_and_label(self, tag: str, attrs: Attrs) -> tuple[str, str]:
         if not (id := attrs.get("id")):
@@ -85,47 +198,26 @@ class SvgContentHandler(sax.ContentHandler):
         return id, label
 
     def get_transform(self, _tag: str, attrs: Attrs, unit_scaling: Matrix | None = None) -> Matrix:
-        transforms: list[Matrix] = []
-
         if unit_scaling and not (unit_scaling.isNull() or unit_scaling.isUnity()):
-            transforms.append(Matrix(unit_scaling))
+            transform = Matrix(unit_scaling)
+        else:
+            transform = Matrix()
 
         if (
             (tr := attrs.get("transform"))
             and (m := parsers.parse_svg_transform(tr))
             and not (m.isNull() or m.isUnity())
         ):
-            transforms.append(m)
+            transform = transform.multiply(m)
 
-        return reduce(Matrix.multiply, transforms, Matrix())
+        return transform
 
     def get_style(self, _tag: str, attrs: Attrs) -> SvgStyle:
-        pairs = attrs.get("style", "").split(";")
-        pairs = (tuple(v.strip() for v in pair.split(":")) for pair in pairs)
-        data = dict(v for v in pairs if len(v) == 2)
-        fill_color = data.get("fill")
-        stroke_color = data.get("stroke")
-        stroke_width = data.get("stroke-width")
-        font_size = data.get("font-size")
         if self.stack:
             parent = self.stack[-1].style
         else:
             parent = self.default_style
-        style = SvgStyle(*astuple(parent))
-        if fill_color:
-            if fill_color == "none":
-                style.fill_color = None
-            else:
-                style.fill_color = SvgColor(fill_color)
-        else:
-            style.fill_color = None
-        if stroke_color and stroke_color != "none":
-            style.stroke_color = SvgColor(stroke_color)
-        if stroke_width and stroke_width != "none":
-            style.stroke_width = parsers.parse_size(stroke_width, f"css{self.dpi!s}")
-        if font_size:
-            style.font_size = parsers.parse_size(font_size, f"css{self.dpi!s}")
-        return style
+        return self.styles.resolve(parent, attrs, self.dpi)
 
     def get_options(self, tag: str, attrs: Attrs, id_: str, transform: Matrix) -> SvgOptions:
         options = SvgOptions(skip=attrs.get("freecad:skip", False))
@@ -164,19 +256,36 @@ class SvgContentHandler(sax.ContentHandler):
         return id, label, transform, style, options
 
     def startElement(self, tag: str, attrs: Attrs) -> None:
+        if self.template:
+            self.record_start(tag, attrs)
+            return
         if self.muted:
             self.muted.append(tag)
             return
-        if handler := getattr(self, f"start{tag.capitalize()}", None):
+        if not self.stack:
+            self.bind_namespaces(attrs)
+        # Unhandled tags (metadata, sodipodi:*, ...) cost a single dict lookup
+        if entry := self.start_dispatch.get(tag):
+            name, handler = entry
             self.count += 1
-            handler(tag, attrs)
+            if self.in_defs:
+                self.record(tag, attrs)
+            else:
+                handler(self, name, attrs)
 
     def endElement(self, tag: str) -> None:
+        if self.template:
+            if self.muted:
+                self.muted.pop()
+            if self.template.end(tag):
+                self.template = None
+            return
         if self.muted:
             self.muted.pop()
             return
-        if handler := getattr(self, f"end{tag.capitalize()}", None):
-            handler(tag)
+        if entry := self.end_dispatch.get(tag):
+            name, handler = entry
+            handler(self, name)
 
     def startRootSvg(self, _tag: str, attrs: Attrs) -> None:
         frame = StackFrame(
@@ -224,7 +333,37 @@ class SvgContentHandler(sax.ContentHandler):
         self.push(StackFrame(group, options, style, transform))
 
     def startSymbol(self, tag: str, attrs: Attrs) -> None:
-        self.startSvg(tag, attrs)
+        if self.replaying:
+            self.startSvg(tag, attrs)
+        else:
+            self.record(tag, attrs)
+
+    def startDefs(self, _tag: str, _attrs: Attrs) -> None:
+        # <defs> has no shape, do not shift the auto ids that follow
+        self.count -= 1
+        self.in_defs = True
+
+    def record(self, tag: str, attrs: Attrs) -> None:
+        """Record the element as a template instead of creating shapes."""
+        parent = self.stack[-1]
+        frame = StackFrame(None, parent.options, parent.style, parent.transform)
+        self.template = SvgTemplate(self, frame, self.count - 1)
+        self.record_start(tag, attrs)
+
+    def record_start(self, tag: str, attrs: Attrs) -> None:
+        # Count and mute as if parsed, so auto ids are the same when replayed
+        if self.muted:
+            self.muted.append(tag)
+        elif entry := self.start_dispatch.get(tag):
+            # The first element was counted before recording started
+            if self.template.depth:
+                self.count += 1
+            if entry[0] in _MUTED_TAGS:
+                self.muted.append(tag)
+        attrs = dict(attrs)
+        self.template.start(tag, attrs)
+        if id := attrs.get("id"):
+            self.index.add_template(id, self.template)
 
     def startPath(self, tag: str, attrs: Attrs) -> None:
         id, label, transform, style, options = self.get_common(tag, attrs)
@@ -238,6 +377,7 @@ class SvgContentHandler(sax.ContentHandler):
             attrs.get("d"),
             self.discretization,
             self.precision,
+            self.merge_curves,
         )
         self.push(StackFrame(path, options, style, transform))
 
@@ -310,6 +450,9 @@ class SvgContentHandler(sax.ContentHandler):
     def characters(self, content: str) -> None:
         if self.muted:
             return
+        if self.template:
+            self.template.characters(content)
+            return
         if self.stack and (text := self.stack[-1].shape) and isinstance(text, SvgText):
             text.append(content)
 
@@ -359,6 +502,9 @@ class SvgContentHandler(sax.ContentHandler):
     def endSymbol(self, _tag: str) -> None:
         self.stack.pop()
 
+    def endDefs(self, _tag: str) -> None:
+        self.in_defs = False
+
     def endSvg(self, _tag: str) -> None:
         self.root = self.stack.pop().shape
 
@@ -375,14 +521,30 @@ class SvgParseResult:
     root: SvgGroup
     index: SvgIndex
     hash: str
+    query: SvgQuery | None = None
+
+    def objects(self, query: SvgQuery | None = None) -> Generator[SvgObject, None, None]:
+        """
+        Return a flat generator with all parsed svg objects.
+
+        If a query is given (or was given to parse), only matching objects are
+        returned and groups that cannot contain matches are not walked.
+        """
+        if query is None:
+            query = self.query
+        if query is None:
+            objects = self.root.objects
+        else:
+            root = self.root
+            walked: list[SvgObject] = []
+            root.collect_objects(root.transform, root.id, walked, query.may_contain)
+            objects = [obj for obj in walked if query.matches(obj)]
 
-    def objects(self) -> Generator[SvgObject, None, None]:
-        """Return a flat generator with all parsed svg objects."""
         if origin := self.index.find("freecad_origin"):
             shape = origin.to_shape()
             if shape:
                 vec = shape.CenterOfGravity * -1
-                for obj in self.root.objects:
+                for obj in objects:
                     base = obj.shape
                     if isinstance(base, SvgGroup) or obj.id == "freecad_origin":
                         continue
@@ -390,27 +552,135 @@ class SvgParseResult:
                     yield obj
                 return
 
-        for obj in self.root.objects:
+        for obj in objects:
             if not isinstance(obj.shape, SvgGroup):
                 yield obj
 
+    def release(self) -> None:
+        """
+        Drop the geometry cached while building the objects.
+
+        Call it once the objects are exported, the cache only holds the shapes
+        of the parse being imported.
+        """
+        shape_cache.clear()
+
+    def scan(self) -> Generator[SvgObjectInfo, None, None]:
+        """
+        Return a flat generator with the metadata of all parsed svg objects.
+
+        This is an index scan: no geometry is built, bounding boxes are computed
+        from the svg coordinates. The freecad_origin offset is taken from the center
+        of its bounding box.
+        """
+        dx = dy = 0.0
+        origin = self.index.find("freecad_origin")
+        if origin and (origin_bounds := origin.bounds()):
+            dx, dy = origin_bounds.center
+        else:
+            origin = None
+
+        for obj in self.root.objects:
+            shape = obj.shape
+            if isinstance(shape, SvgGroup) or (origin and obj.id == "freecad_origin"):
+                continue
+            bounds = shape.bounds()
+            if bounds and origin:
+                bounds = bounds.moved(-dx, -dy)
+            yield SvgObjectInfo(obj.id, shape.tag, shape.label, obj.path, obj.href, bounds)
+
+
+class HashingReader:
+    """
+    Binary stream wrapper that hashes the data as it is read.
+
+    The sax IncrementalParser pulls fixed-size chunks from the stream,
+    so the file is never held in memory as a whole.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self.md5 = md5(usedforsecurity=False)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.md5.update(data)
+        return data
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def hexdigest(self) -> str:
+        return self.md5.hexdigest()
+
+
+class UnsafeSvgError(Exception):
+    """Svg file uses xml features that are forbidden for security reasons."""
+
+
+def _forbid_entities(name: str, *_args) -> None:
+    msg = f"Entity declarations are forbidden: {name}"
+    raise UnsafeSvgError(msg)
+
+
+def _forbid_external(_context: str, _base: str, system_id: str, *_args) -> None:
+    msg = f"External entity references are forbidden: {system_id}"
+    raise UnsafeSvgError(msg)
+
+
+def parse_sax(stream: BinaryIO, handler: SvgContentHandler) -> None:
+    parser = make_parser()  # nosec: defusedxml version used if available, # noqa: S317
+    parser.setFeature(sax.handler.feature_external_ges, False)  # noqa: FBT003
+    parser.setContentHandler(handler)
+    source = sax.xmlreader.InputSource()
+    source.setByteStream(stream)
+    source.setEncoding("utf-8")
+    parser.parse(source)
+
+
+def parse_expat(stream: BinaryIO, handler: SvgContentHandler) -> None:
+    """
+    Drive pyexpat directly, skipping the sax reader layer.
+
+    Mirrors defusedxml defaults: entity declarations and external references
+    are rejected and external DTD/parameter entities are never loaded.
+    """
+    parser = expat.ParserCreate("utf-8")  # nosec B313
+    parser.buffer_text = True
+    parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_NEVER)
+    parser.EntityDeclHandler = _forbid_entities
+    parser.UnparsedEntityDeclHandler = _forbid_entities
+    parser.ExternalEntityRefHandler = _forbid_external
+    parser.StartElementHandler = handler.startElement
+    parser.EndElementHandler = handler.endElement
+    parser.CharacterDataHandler = handler.characters
+    parser.ParseFile(stream)
+
+
+_BACKENDS = {
+    "sax": parse_sax,
+    "expat": parse_expat,
+}
+
 
 def parse(
     filename: str | Path,
     preferences: SvgImportPreferences,
     dpi_fallback: float = 96.0,
+    query: SvgQuery | None = None,
+    backend: str | None = None,
 ) -> SvgParseResult:
-    parser = make_parser()  # nosec: defusedxml version used if available, # noqa: S317
-    parser.setFeature(sax.handler.feature_external_ges, False)  # noqa: FBT003
-    handler = SvgContentHandler(preferences, dpi_fallback)
-    parser.setContentHandler(handler)
+    """
+    Parse an svg file.
 
-    raw = Path(filename).read_bytes()
-    file_hash = md5(raw, usedforsecurity=False).hexdigest()
+    The xml backend ('sax' or 'expat') is taken from preferences unless given.
+    """
+    shape_cache.configure(preferences.shape_cache_size() * 2**20)
+    handler = SvgContentHandler(preferences, dpi_fallback)
+    parse_stream = _BACKENDS.get(backend or preferences.parser_backend(), parse_sax)
 
-    source = sax.xmlreader.InputSource()
-    source.setByteStream(BytesIO(raw))
-    source.setEncoding("utf-8")
-    parser.parse(source)
+    with Path(filename).open("rb") as stream:
+        reader = HashingReader(stream)
+        parse_stream(reader, handler)
 
-    return SvgParseResult(handler.root, handler.index, file_hash)
+    return SvgParseResult(handler.root, handler.index, reader.hexdigest(), query)
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import re
 import math
+from functools import lru_cache
 from FreeCAD import Matrix, Vector  # type: ignore
 from typing import TYPE_CHECKING
 
@@ -119,6 +120,80 @@ def parse_floats(text: str) -> list[float]:
     return [float(v) for v, _exp in _FLOAT_RE.findall(text)]
 
 
+# Number of arguments read per segment by each path command
+_PATH_ARITY = {
+    cmd: arity
+    for cmds, arity in (("Zz", 0), ("HhVv", 1), ("MmLlTt", 2), ("SsQq", 4), ("Cc", 6), ("Aa", 7))
+    for cmd in cmds
+}
+# Svg number grammar, including the compact forms "1." and ".5"
+_PATH_NUMBER = r"[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+_PATH_NUMBER_RE = re.compile(_PATH_NUMBER)
+# Path data token: a number, or any other single character (command or error)
+_PATH_TOKEN_RE = re.compile(rf"[\s,]*(?:({_PATH_NUMBER})|([^\s,]))")
+# Arguments of an arc segment read as flags: large-arc-flag and sweep-flag
+_PATH_ARC_FLAGS = (3, 4)
+
+
+def tokenize_path(d: str) -> list[tuple[str, list[float]]]:
+    """
+    Split svg path data into commands and their numeric arguments in a single pass.
+
+    The string is scanned once, token after token. Compact forms like "M1.5.5"
+    are split as a browser would read them, and arc flags are read as single
+    digits ("a1 1 0 00 1 1" has seven arguments).
+
+    As the svg spec requires, the path is kept up to the first error: the
+    command in error keeps its complete segments (arity of the command), and
+    nothing after it is read.
+    """
+    tokens: list[tuple[str, list[float]]] = []
+    args: list[float] = []
+    size, arc = 0, False
+    arity, scan = _PATH_ARITY, _PATH_TOKEN_RE.scanner(d).match
+    while m := scan():
+        if value := m[1]:
+            # Numbers before any command or after close path are errors
+            if not size:
+                break
+            if arc and len(args) % size in _PATH_ARC_FLAGS:
+                if not _read_arc_flags(args, value):
+                    break
+            else:
+                args.append(float(value))
+        elif (cmd_size := arity.get(cmd := m[2])) is None or (size and not _complete(args, size)):
+            break
+        else:
+            args = []
+            tokens.append((cmd, args))
+            size, arc = cmd_size, cmd in "Aa"
+    if size:
+        _complete(args, size)
+    return tokens
+
+
+def _read_arc_flags(args: list[float], text: str) -> bool:
+    """Read a number token at a flag of an arc, one digit per flag. False if malformed."""
+    while text and len(args) % 7 in _PATH_ARC_FLAGS:
+        if text[0] not in "01":
+            return False
+        args.append(float(text[0]))
+        text = text[1:]
+    if text:
+        # Remaining digits are the next argument: "a1 1 0 0110 10"
+        if not _PATH_NUMBER_RE.fullmatch(text):
+            return False
+        args.append(float(text))
+    return True
+
+
+def _complete(args: list[float], size: int) -> bool:
+    """Drop an incomplete last segment, False if there was one or no segment at all."""
+    if extra := len(args) % size:
+        del args[-extra:]
+    return bool(args) and not extra
+
+
 def parse_inkscape_version(text: str) -> float:
     inks_ver_pars = _INK_VERSION_RE.search(text)
     if inks_ver_pars is not None:
@@ -135,10 +210,17 @@ def style_split(content: str) -> list[tuple[str, str]]:
     return [(term[0].strip(), term[1].strip()) for term in rules if len(term) > 1]
 
 
+# Max number of distinct transform strings kept by parse_svg_transform
+TRANSFORM_CACHE_SIZE = 4096
+
+
 def parse_svg_transform(tr: str) -> Matrix:
     """
     Return a FreeCAD matrix from an SVG transform attribute.
 
+    Parsed matrices are memoized by transform string, a new copy is returned
+    on each call so callers are free to mutate it.
+
     Parameters
     ----------
     tr : str
@@ -151,6 +233,11 @@ def parse_svg_transform(tr: str) -> Matrix:
         The translated matrix.
 
     """
+    return Matrix(_parse_svg_transform(tr))
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _parse_svg_transform(tr: str) -> Matrix:
     m = Matrix()
     for transformation, args in SvgTransformations(tr):
         if transformation == "translate":
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import math
-import re
 from dataclasses import dataclass
 from .face_tree import FaceTreeNode
 
@@ -22,16 +21,30 @@ from Part import (  # type: ignore
 )
 from Part import makeCompound as make_compound  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, CenterArc, affine, arc_center, arc_centers
 from .cache import cached_copy, cached_copy_list
-from .geom import DraftPrecision, precision_step, arc_end_to_center, make_wire, equals
-from .parsers import parse_floats
+from .geom import (
+    DraftPrecision,
+    precision_step,
+    make_wire,
+    transform_shape,
+)
+from . import path_data
+from .parsers import tokenize_path
+from .path_data import ARITY, PathData, same_point
 from .shape import SvgShape
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING
 from contextlib import suppress
-from itertools import chain, count
+from itertools import chain, count, pairwise
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
+
+# Initial number of samples of approximated curves
+MIN_APPROX_POINTS = 4
+
+# Angle (radians) between tangents accepted as a smooth join of curves
+SMOOTH_JOIN_ANGLE = 1e-3
 
 
 class PathCommands:
@@ -39,368 +52,229 @@ class PathCommands:
     Path segments parser.
     """
 
-    _op = "([mMlLhHvVaAcCqQsStTzZ])"
-    _args = "([^mMlLhHvVaAcCqQsStTzZ]*)"
-    _command = "\\s*?" + _op + "\\s*?" + _args + "\\s*?"
-    regex = re.compile(_command, re.DOTALL)
-
     def __init__(self, d: str) -> None:
-        regex = self.regex
-        self.commands = [(cmd, parse_floats(args)) for cmd, args in regex.findall(d)]
+        self.commands = tokenize_path(d)
 
-    def __iter__(self) -> re.Iterator[tuple[str, list[float]]]:
+    def __iter__(self) -> Iterator[tuple[str, list[float]]]:
         return iter(self.commands)
 
 
-@dataclass
-class PathBreak(Exception):  # noqa: N818
-    """
-    Svg subpath termination.
-    """
-
-    point: Vector
-    end: bool
-
-
 class InvalidPathDataError(Exception):
     """Unacceptable svg path data."""
 
 
-class SvgSubPath:
-    """Disconnected subpath."""
-
-    def __init__(self, discretization: int, precision: int, origin: Vector | None = None) -> None:
-        self.path = [{"type": "start", "last_v": origin or Vector(0, 0, 0)}]
-        self.discretization = discretization
-        self.precision = precision
-
-    def add_line(self, d: str, args: list[float], *, relative: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        if d in "Mm":
-            x = args.pop(0)
-            y = args.pop(0)
-            if relative:
-                last_v = last_v.add(Vector(x, -y, 0))
-            else:
-                last_v = Vector(x, -y, 0)
-            # if we're at the beginning of a wire we overwrite the start vector
-            if self.path[-1]["type"] == "start":
-                self.path[-1]["last_v"] = last_v
-            else:
-                self.path.append({"type": "start", "last_v": last_v})
-
-        for x, y in zip(args[0::2], args[1::2], strict=False):
-            if relative:
-                last_v = last_v.add(Vector(x, -y, 0))
-            else:
-                last_v = Vector(x, -y, 0)
-            self.path.append({"type": "line", "last_v": last_v})
-
-    def add_horizontal(self, args: list[float], relative: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        for x in args:
-            if relative:
-                last_v = Vector(x + last_v.x, last_v.y, 0)
-            else:
-                last_v = Vector(x, last_v.y, 0)
-            self.path.append({"type": "line", "last_v": last_v})
-
-    def add_vertical(self, args: list[float], relative: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        for y in args:
-            if relative:
-                last_v = Vector(last_v.x, last_v.y - y, 0)
-            else:
-                last_v = Vector(last_v.x, -y, 0)
-            self.path.append({"type": "line", "last_v": last_v})
-
-    def add_arc(self, args: list[float], relative: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        p_iter = zip(
-            args[0::7],
-            args[1::7],
-            args[2::7],
-            args[3::7],
-            args[4::7],
-            args[5::7],
-            args[6::7],
-            strict=False,
-        )
-        for rx, ry, x_rotation, large_flag, sweep_flag, x, y in p_iter:
-            # support for large-arc and x-rotation is missing
-            if relative:
-                last_v = last_v.add(Vector(x, -y, 0))
-            else:
-                last_v = Vector(x, -y, 0)
-            self.path.append({
-                "type": "arc",
-                "rx": rx,
-                "ry": ry,
-                "x_rotation": x_rotation,
-                "large_flag": large_flag,
-                "sweep_flag": sweep_flag,
-                "last_v": last_v,
-            })
-
-    def add_cubic_bezier(self, args: list[float], relative: bool, smooth: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        if smooth:
-            p_iter = list(
-                zip(
-                    args[2::4],
-                    args[3::4],
-                    args[0::4],
-                    args[1::4],
-                    args[2::4],
-                    args[3::4],
-                    strict=False,
-                ),
-            )
-        else:
-            p_iter = list(
-                zip(
-                    args[0::6],
-                    args[1::6],
-                    args[2::6],
-                    args[3::6],
-                    args[4::6],
-                    args[5::6],
-                    strict=False,
-                ),
-            )
-        for p1x, p1y, p2x, p2y, x, y in p_iter:
-            if smooth:
-                if self.path[-1]["type"] == "cbezier":
-                    pole1 = last_v.sub(self.path[-1]["pole2"]).add(last_v)
+def create_edges(  # noqa: C901, PLR0912, PLR0913, PLR0915, PLR0917
+    data: PathData,
+    subpath: int,
+    discretization: int,
+    precision: int,
+    merge_curves: bool = False,
+    degenerate: Sequence[bool] | None = None,
+) -> list[Edge]:
+    """
+    Return ordered list of segments of a subpath.
+
+    Approximated curves deviate at most half the coordinate resolution,
+    with no more than discretization points. If merge_curves is True,
+    runs of tangent continuous beziers become a single bspline edge.
+    degenerate are the flags of PathData.degenerate, computed if not given.
+    """
+    edges = []
+    tolerance = precision_step(precision) / 2
+    run: list[list[Vector]] = []  # Poles of the pending smooth beziers
+
+    def flush() -> None:
+        if len(run) > 1:
+            edges.append(merge_beziers(run, precision_step(DraftPrecision + 2)).toShape())
+        elif run:
+            b = BezierCurve()
+            b.setPoles(run[0])
+            edges.append(b.toShape())
+        run.clear()
+
+    def add_bezier(poles: list[Vector]) -> None:
+        if merge_curves and not is_degenerate_bezier(poles):
+            if run and not is_smooth_join(run[-1], poles):
+                flush()
+            run.append(poles)
+            return
+        flush()
+        b = BezierCurve()
+        b.setPoles(poles)
+        edges.append(approx_bspline(b, tolerance, discretization).toShape())
+
+    coords = data.coords
+    first, end, offset = data.subpath(subpath)
+    arcs = subpath_arcs(data, first, end, offset)
+    if degenerate is None:
+        degenerate = data.degenerate(precision)
+    lx = ly = 0.0
+    for segment, (kind, i) in enumerate(data.segments(first, end, offset), first):
+        nx, ny = coords[i + ARITY[kind] - 2], coords[i + ARITY[kind] - 1]
+        match kind:
+            case path_data.START:
+                pass
+
+            case path_data.LINE:
+                if degenerate[segment]:
+                    # line segment too short, we simply skip it
+                    nx, ny = lx, ly
                 else:
-                    pole1 = last_v
-            else:  # noqa: PLR5501
-                if relative:
-                    pole1 = last_v.add(Vector(p1x, -p1y, 0))
+                    flush()
+                    edges.append(LineSegment(Vector(lx, ly, 0), Vector(nx, ny, 0)).toShape())
+
+            case path_data.ARC:
+                rx, ry, x_rotation, large_flag, sweep_flag = coords[i : i + 5]
+                (x1, y1, *_), arc = next(arcs)
+                phi = math.radians(x_rotation)
+                if x1 != lx or y1 != -ly:
+                    # Start moved by a skipped segment
+                    arc = arc_center(lx, -ly, nx, -ny, rx, ry, phi, large_flag, sweep_flag)
+                if arc:
+                    flush()
+                    edges.append(arc_edge(arc, phi))
+                elif same_point(lx, ly, nx, ny, precision):
+                    # arc too short, skipping
+                    nx, ny = lx, ly
                 else:
-                    pole1 = Vector(p1x, -p1y, 0)
-            if relative:
-                pole2 = last_v.add(Vector(p2x, -p2y, 0))
-                last_v = last_v.add(Vector(x, -y, 0))
-            else:
-                pole2 = Vector(p2x, -p2y, 0)
-                last_v = Vector(x, -y, 0)
-
-            self.path.append({
-                "type": "cbezier",
-                "pole1": pole1,
-                "pole2": pole2,
-                "last_v": last_v,
-            })
-
-    def add_quadratic_bezier(self, args: list[float], relative: bool, smooth: bool) -> None:
-        last_v = self.path[-1]["last_v"]
-        if smooth:
-            p_iter = list(
-                zip(
-                    args[1::2],
-                    args[1::2],
-                    args[0::2],
-                    args[1::2],
-                    strict=False,
-                ),
-            )
-        else:
-            p_iter = list(
-                zip(
-                    args[0::4],
-                    args[1::4],
-                    args[2::4],
-                    args[3::4],
-                    strict=False,
-                ),
-            )
-        for px, py, x, y in p_iter:
-            if smooth:
-                if self.path[-1]["type"] == "qbezier":
-                    pole = last_v.sub(self.path[-1]["pole"]).add(last_v)
+                    # null radius, svg renders a line
+                    flush()
+                    edges.append(LineSegment(Vector(lx, ly, 0), Vector(nx, ny, 0)).toShape())
+
+            case path_data.CUBIC:
+                last_v, next_v = Vector(lx, ly, 0), Vector(nx, ny, 0)
+                pole1 = Vector(coords[i], coords[i + 1], 0)
+                pole2 = Vector(coords[i + 2], coords[i + 3], 0)
+                _precision = precision_step(DraftPrecision + 2)
+                _d1 = pole1.distanceToLine(last_v, next_v)
+                _d2 = pole2.distanceToLine(last_v, next_v)
+                if _d1 < _precision and _d2 < _precision:
+                    # poles and endpoints are all on a line
+                    flush()
+                    _seg = LineSegment(last_v, next_v)
+                    edges.append(_seg.toShape())
                 else:
-                    pole = last_v
-            else:  # noqa: PLR5501
-                if relative:
-                    pole = last_v.add(Vector(px, -py, 0))
+                    add_bezier([last_v, pole1, pole2, next_v])
+
+            case path_data.QUAD:
+                if degenerate[segment]:
+                    # segment too small - skipping.
+                    nx, ny = lx, ly
                 else:
-                    pole = Vector(px, -py, 0)
-            if relative:
-                last_v = last_v.add(Vector(x, -y, 0))
-            else:
-                last_v = Vector(x, -y, 0)
-
-            self.path.append({
-                "type": "qbezier",
-                "pole": pole,
-                "last_v": last_v,
-            })
-
-    def get_last_start(self) -> Vector:
-        """Find the last Path data element of type 'start'."""
-        for dct in reversed(self.path):
-            if dct["type"] == "start":
-                return dct["last_v"]
-        return Vector(0, 0, 0)
-
-    def correct_last_v(self, path_data: dict, delta: Vector) -> None:
-        """
-        Correct the endpoint of the given path dataset.
-
-        given a delta, move possibly associated member accordingly.
-        """
-        if path_data["type"] == "cbezier":
-            # for cbezier we also relocate the second pole
-            path_data["pole2"] = path_data["pole2"].sub(delta)
-        elif path_data["type"] == "qbezier":
-            # for qbezier we also relocate the pole by half of the delta
-            path_data["pole"] = path_data["pole"].sub(delta.scale(0.5, 0.5, 0))
-        # all data types have last_v
-        path_data["last_v"] = path_data["last_v"].sub(delta)
-
-    def add_close(self) -> NoReturn:
-        last_v = self.path[-1]["last_v"]
-        first_v = self.get_last_start()
-        if equals(last_v, first_v, self.precision):
-            # we assume identity of first and last at configured precision.
-            # So we have to make sure that they really are identical
-            self.correct_last_v(self.path[-1], last_v.sub(first_v))
-        else:
-            self.path.append({"type": "line", "last_v": first_v})
-        raise PathBreak(first_v, end=False)
-
-    def start(self, commands: Iterator[tuple[str, list[float]]]) -> NoReturn:
-        for d, args in commands:
-            relative = d.islower()
-            smooth = d in "sStT"
-
-            if d in "LlMm" and args:
-                self.add_line(d, args, relative=relative)
-
-            elif d in "Hh":
-                self.add_horizontal(args, relative)
-
-            elif d in "Vv":
-                self.add_vertical(args, relative)
-
-            elif d in "Aa":
-                self.add_arc(args, relative)
-
-            elif d in "CcSs":
-                self.add_cubic_bezier(args, relative, smooth)
-
-            elif d in "QqTt":
-                self.add_quadratic_bezier(args, relative, smooth)
-
-            elif d in "Zz":
-                self.add_close()
-
-        raise PathBreak(self.path[-1]["last_v"], end=True)
-
-    def create_edges(self) -> list[Edge]:
-        """Return ordered lits segments from path data."""
-        if type(self.path[0]) is not dict:
-            return None
-
-        edges = []
-        last_v = Vector(0, 0, 0)
-        for pdset in self.path:
-            next_v = pdset["last_v"]
-            match pdset["type"]:
-                case "start":
-                    last_v = next_v
-
-                case "line":
-                    if equals(last_v, next_v, self.precision):
-                        # line segment too short, we simply skip it
-                        next_v = last_v
-                    else:
-                        edges.append(LineSegment(last_v, next_v).toShape())
-
-                case "arc":
-                    rx = pdset["rx"]
-                    ry = pdset["ry"]
-                    x_rotation = pdset["x_rotation"]
-                    large_flag = pdset["large_flag"]
-                    sweep_flag = pdset["sweep_flag"]
-                    # Calculate the possible centers for an arc
-                    # in 'endpoint parameterization'.
-                    _x_rot = math.radians(-x_rotation)
-                    (solution, (rx, ry)) = arc_end_to_center(
-                        last_v,
-                        next_v,
-                        rx,
-                        ry,
-                        x_rotation=_x_rot,
-                        correction=True,
-                    )
-                    # Choose one of the two solutions
-                    neg_sol = large_flag != sweep_flag
-                    v_center, angle1, angle_delta = solution[neg_sol]
-                    if ry > rx:
-                        rx, ry = ry, rx
-                        swap_axis = True
-                    else:
-                        swap_axis = False
-                    e1 = Ellipse(v_center, rx, ry)
-                    if sweep_flag:
-                        angle1 = angle1 + angle_delta
-                        angle_delta = -angle_delta
-
-                    d90 = math.radians(90)
-                    e1a = Arc(e1, angle1 - swap_axis * d90, angle1 + angle_delta - swap_axis * d90)
-                    seg = e1a.toShape()
-                    if swap_axis:
-                        seg.rotate(v_center, Vector(0, 0, 1), 90)
-                    _precision = precision_step(DraftPrecision)
-                    if abs(x_rotation) > _precision:
-                        seg.rotate(v_center, Vector(0, 0, 1), -x_rotation)
-                    if sweep_flag:
-                        seg.reverse()
-                    edges.append(seg)
-
-                case "cbezier":
-                    pole1 = pdset["pole1"]
-                    pole2 = pdset["pole2"]
+                    last_v, next_v = Vector(lx, ly, 0), Vector(nx, ny, 0)
+                    pole = Vector(coords[i], coords[i + 1], 0)
                     _precision = precision_step(DraftPrecision + 2)
-                    _d1 = pole1.distanceToLine(last_v, next_v)
-                    _d2 = pole2.distanceToLine(last_v, next_v)
-                    if _d1 < _precision and _d2 < _precision:
-                        # poles and endpoints are all on a line
+                    _distance = pole.distanceToLine(last_v, next_v)
+                    if _distance < _precision:
+                        # pole is on the line
+                        flush()
                         _seg = LineSegment(last_v, next_v)
-                        seg = _seg.toShape()
+                        edges.append(_seg.toShape())
                     else:
-                        b = BezierCurve()
-                        b.setPoles([last_v, pole1, pole2, next_v])
-                        seg = approx_bspline(b, self.discretization).toShape()
-                    edges.append(seg)
-
-                case "qbezier":
-                    if equals(last_v, next_v, self.precision):
-                        # segment too small - skipping.
-                        next_v = last_v
-                    else:
-                        pole = pdset["pole"]
-                        _precision = precision_step(DraftPrecision + 2)
-                        _distance = pole.distanceToLine(last_v, next_v)
-                        if _distance < _precision:
-                            # pole is on the line
-                            _seg = LineSegment(last_v, next_v)
-                            seg = _seg.toShape()
-                        else:
-                            b = BezierCurve()
-                            b.setPoles([last_v, pole, next_v])
-                            seg = approx_bspline(b, self.discretization).toShape()
-                        edges.append(seg)
+                        add_bezier([last_v, pole, next_v])
+
+            case _:
+                msg = f"Illegal path_data type. {kind}"
+                raise InvalidPathDataError(msg)
+
+        lx, ly = nx, ny
 
-                case _:
-                    msg = f"Illegal path_data type. {pdset['type']}"
-                    raise InvalidPathDataError(msg)
+    flush()
+    return edges
 
-            last_v = next_v
 
-        return edges
+def subpath_arcs(data: PathData, first: int, end: int, offset: int) -> Iterator:
+    """
+    Yield (endpoint row, center parameterization) of the arcs in [first, end).
+
+    Rows are in svg orientation (see arc_center), all arcs are converted in
+    one batch.
+    """
+    if path_data.ARC not in data.codes[first:end]:
+        return iter(())
+    coords = data.coords
+    rows = []
+    x = y = 0.0
+    for kind, i in data.segments(first, end, offset):
+        nx, ny = coords[i + ARITY[kind] - 2], coords[i + ARITY[kind] - 1]
+        if kind == path_data.ARC:
+            rx, ry, x_rotation, large_flag, sweep_flag = coords[i : i + 5]
+            rows.append(
+                (x, -y, nx, -ny, rx, ry, math.radians(x_rotation), large_flag, sweep_flag),
+            )
+        x, y = nx, ny
+    return zip(rows, arc_centers(rows), strict=True)
+
+
+def arc_edge(arc: CenterArc, phi: float) -> Edge:
+    """Build the edge of an arc given in center parameterization (see arc_center)."""
+    acx, acy, rx, ry, theta1, delta = arc
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    center = Vector(acx, -acy, 0)
+    # Ellipse axes with the svg y axis flipped, angles change sign
+    u = Vector(cos_phi, -sin_phi, 0)
+    w = Vector(sin_phi, cos_phi, 0)
+    start, end = -theta1, -theta1 - delta
+    if rx >= ry:
+        ellipse = Ellipse(center + u * rx, center + w * ry, center)
+    else:
+        # Major axis along w, angles shift by a quarter turn
+        ellipse = Ellipse(center + w * ry, center - u * rx, center)
+        start, end = start - math.pi / 2, end - math.pi / 2
+    if start < end:
+        return Arc(ellipse, start, end).toShape()
+    seg = Arc(ellipse, end, start).toShape()
+    seg.reverse()
+    return seg
+
+
+def is_degenerate_bezier(poles: list[Vector], tol: float = 1e-7) -> bool:
+    """Check for a null derivative at one end, see approx_bspline."""
+    return (poles[1] - poles[0]).Length < tol or (poles[-1] - poles[-2]).Length < tol
+
+
+def is_smooth_join(prev: list[Vector], poles: list[Vector]) -> bool:
+    """Check if two beziers of the same degree meet with the same tangent direction."""
+    if len(prev) != len(poles):
+        return False
+    a = prev[-1] - prev[-2]
+    b = poles[1] - poles[0]
+    cross = a.x * b.y - a.y * b.x
+    return a.dot(b) > 0 and abs(cross) <= SMOOTH_JOIN_ANGLE * a.Length * b.Length
+
+
+def merge_beziers(run: list[list[Vector]], tol: float) -> BSplineCurve:
+    """
+    Join consecutive beziers of the same degree into a single bspline.
+
+    Interior knots get full multiplicity, so the curve is exactly the chain
+    of beziers. Knots are spaced to match the tangent lengths at the joins,
+    then their multiplicity is reduced where the curve allows it within tol.
+    """
+    degree = len(run[0]) - 1
+    poles = [run[0][0]]
+    knots = [0.0, 1.0]
+    span = 1.0
+    for prev, segment in pairwise(run):
+        # Same derivative on both sides of the join if possible
+        span *= (segment[1] - segment[0]).Length / (prev[-1] - prev[-2]).Length
+        knots.append(knots[-1] + span)
+    for segment in run:
+        poles.extend(segment[1:])
+    mults = [degree + 1] + [degree] * (len(run) - 1) + [degree + 1]
+    bs = BSplineCurve()
+    bs.buildFromPolesMultsKnots(
+        poles=poles,
+        mults=mults,
+        knots=knots,
+        periodic=False,
+        degree=degree,
+    )
+    # Knot indices are 1 based, reducing multiplicities keeps them stable
+    for index in range(len(run), 1, -1):
+        with suppress(Exception):
+            bs.removeKnot(index, degree - 1, tol)
+    return bs
 
 
 @dataclass
@@ -410,6 +284,7 @@ class SvgPath(SvgShape):
     d: str
     discretization: int
     precision: int
+    merge_curves: bool = False
 
     @cached_copy
     def to_shape(self) -> Shape | None:
@@ -417,56 +292,51 @@ class SvgPath(SvgShape):
             return make_compound(paths)
         return None
 
-    def _compute_sub_paths(self) -> list[SvgSubPath]:
-        paths: list[SvgSubPath] = []
-        commands = iter(PathCommands(self.d))
-        path = SvgSubPath(self.discretization, self.precision)
-        paths.append(path)
-        while True:
-            try:
-                path.start(commands)
-            except PathBreak as ex:  # noqa: PERF203
-                if ex.end:
-                    break
-                path = SvgSubPath(self.discretization, self.precision, ex.point)
-                paths.append(path)
-
-        if len(paths[-1].path) == 1 and paths[-1].path[0]["type"] == "start":
-            # nothing more than the start preamble - delete.
-            paths.pop()
+    def bounds(self) -> Bounds | None:
+        builder = BoundsBuilder(affine(self.transform))
+        path_bounds(self.data(), builder)
+        return builder.bounds or None
 
-        return paths
+    def data(self) -> PathData:
+        return PathData.from_commands(PathCommands(self.d or ""), self.precision)
 
     @cached_copy_list
     def shapes(self) -> list[Shape]:
-        paths = self._compute_sub_paths()
+        data = self.data()
         cnt = count(1)
         open_shapes: list[Shape] = []
         faces = FaceTreeNode()
 
-        for sub_path in paths:
-            if sub_path.path:
-                edges = sub_path.create_edges()
-                if not edges:
-                    continue
-                sh = make_wire(edges, self.precision, check_closed=True)
-                add_wire = True
-
-                if self.style.fill_color and len(sh.Wires) == 1 and sh.Wires[0].isClosed():
-                    with suppress(Exception):
-                        face = Face(sh)
-                        if face.isValid():
-                            add_wire = False
-                        else:
-                            face.fix(1e-6, 0, 1)
-
-                        if face.Area > 10 * (precision_step(self.precision) ** 2):
-                            faces.insert(face, f"{self.id}_f{next(cnt)}")
-                        else:
-                            add_wire = False
-
-                if add_wire:
-                    open_shapes.append(sh)
+        degenerate = data.degenerate(self.precision)
+        for subpath in range(data.subpath_count):
+            edges = create_edges(
+                data,
+                subpath,
+                self.discretization,
+                self.precision,
+                self.merge_curves,
+                degenerate,
+            )
+            if not edges:
+                continue
+            sh = make_wire(edges, self.precision, check_closed=True)
+            add_wire = True
+
+            if self.style.fill_color and len(sh.Wires) == 1 and sh.Wires[0].isClosed():
+                with suppress(Exception):
+                    face = Face(sh)
+                    if face.isValid():
+                        add_wire = False
+                    else:
+                        face.fix(1e-6, 0, 1)
+
+                    if face.Area > 10 * (precision_step(self.precision) ** 2):
+                        faces.insert(face, f"{self.id}_f{next(cnt)}")
+                    else:
+                        add_wire = False
+
+            if add_wire:
+                open_shapes.append(sh)
 
         faces.make_cuts()
         tr_faces = (transform_geometry(face, self.transform) for face in faces.flatten())
@@ -474,25 +344,79 @@ class SvgPath(SvgShape):
         return [shape for shape in chain(tr_faces, tr_open) if shape]
 
 
+def path_bounds(data: PathData, builder: BoundsBuilder) -> None:
+    """Accumulate the exact bounds of path data using only float math."""
+    coords = data.coords
+    arcs = subpath_arcs(data, 0, len(data), 0)
+    x = y = 0.0
+    for kind, i in data.segments():
+        nx, ny = coords[i + ARITY[kind] - 2], coords[i + ARITY[kind] - 1]
+        match kind:
+            case path_data.LINE:
+                builder.point(x, y)
+                builder.point(nx, ny)
+            case path_data.CUBIC:
+                p1, p2 = (coords[i], coords[i + 1]), (coords[i + 2], coords[i + 3])
+                builder.cubic((x, y), p1, p2, (nx, ny))
+            case path_data.QUAD:
+                builder.quadratic((x, y), (coords[i], coords[i + 1]), (nx, ny))
+            case path_data.ARC:
+                # arc_center works in svg orientation (y down)
+                phi = math.radians(coords[i + 2])
+                _, arc = next(arcs)
+                if arc:
+                    acx, acy, rx, ry, theta1, delta = arc
+                    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+                    builder.ellipse(
+                        (acx, -acy),
+                        (rx * cos_phi, -rx * sin_phi),
+                        (-ry * sin_phi, -ry * cos_phi),
+                        theta1,
+                        delta,
+                    )
+                else:
+                    builder.point(x, y)
+                    builder.point(nx, ny)
+        x, y = nx, ny
+
+
 def transform_geometry(shape: Shape, transform: Matrix) -> Shape | None:
     try:
-        return shape.transformGeometry(transform)
+        return transform_shape(shape, transform)
     except OCCError:
         return None
 
 
 def approx_bspline(
     curve: BezierCurve,
-    num: int = 10,
+    tolerance: float,
+    max_points: int = 100,
     tol: float = 1e-7,
 ) -> BSplineCurve | BezierCurve:
+    """
+    Replace a bezier with a null derivative at one end by an interpolated bspline.
+
+    Samples are doubled until the bspline deviates less than tolerance from
+    the curve between them, so the number of poles follows size and curvature.
+    """
     _p0, d0 = curve.getD1(curve.FirstParameter)
     _p1, d1 = curve.getD1(curve.LastParameter)
     if (d0.Length < tol) or (d1.Length < tol):
         tan1 = curve.tangent(curve.FirstParameter)[0]
         tan2 = curve.tangent(curve.LastParameter)[0]
+        num = min(MIN_APPROX_POINTS, max_points)
         pts = curve.discretize(num)
-        bs = BSplineCurve()
-        bs.interpolate(Points=pts, InitialTangent=tan1, FinalTangent=tan2)
-        return bs
+        while True:
+            bs = BSplineCurve()
+            bs.interpolate(Points=pts, InitialTangent=tan1, FinalTangent=tan2)
+            if num >= max_points:
+                return bs
+            num = min(2 * num - 1, max_points)
+            pts = curve.discretize(num)
+            if max(bs_deviation(bs, p) for p in pts[1:-1:2]) <= tolerance:
+                return bs
     return curve
+
+
+def bs_deviation(bs: BSplineCurve, point: Vector) -> float:
+    return bs.value(bs.parameter(point)).distanceToPoint(point)
@@ -0,0 +1,317 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""
+Compact intermediate representation of svg path data (no OCC involved).
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+# Segment kinds
+START, LINE, ARC, CUBIC, QUAD = range(5)
+
+# Number of coordinates stored per segment kind, the end point is always last:
+#   START, LINE: x y
+#   ARC: rx ry x_rotation large_flag sweep_flag x y
+#   CUBIC: pole1 pole2 end
+#   QUAD: pole end
+ARITY = (2, 2, 7, 6, 4)
+
+
+class PathData:
+    """
+    Svg path data stored as flat arrays.
+
+    All points are in FreeCAD orientation (svg y axis already flipped).
+
+    codes: one segment kind per segment.
+    coords: segment coordinates, ARITY[kind] values per segment.
+    subpaths: (segment index, coordinate index) pairs where each subpath starts.
+        Subpaths are terminated by a close command or by the end of data.
+    """
+
+    __slots__ = ("codes", "coords", "subpaths")
+
+    def __init__(self) -> None:
+        self.codes = array("b")
+        self.coords = array("d")
+        self.subpaths = array("q")
+
+    @classmethod
+    def from_commands(
+        cls,
+        commands: Iterable[tuple[str, list[float]]],
+        precision: int,
+    ) -> PathData:
+        builder = PathDataBuilder(precision)
+        builder.add_commands(commands)
+        return builder.finish()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def subpath_count(self) -> int:
+        return len(self.subpaths) // 2
+
+    def subpath(self, index: int) -> tuple[int, int, int]:
+        """Return (first segment, end segment, first coordinate) of a subpath."""
+        first, offset = self.subpaths[2 * index], self.subpaths[2 * index + 1]
+        end = self.subpaths[2 * index + 2] if 2 * index + 2 < len(self.subpaths) else len(self)
+        return first, end, offset
+
+    def segments(self, first: int = 0, end: int | None = None, offset: int = 0) -> Iterator:
+        """Yield (kind, coordinate index) for each segment in [first, end)."""
+        codes = self.codes
+        for i in range(first, len(codes) if end is None else end):
+            kind = codes[i]
+            yield kind, offset
+            offset += ARITY[kind]
+
+    def degenerate(self, precision: int) -> list[bool]:
+        """
+        Flag zero length lines and quadratics, one flag per segment.
+
+        A segment has zero length if its end point is the same_point as the
+        current point. Skipped segments do not move the current point, the
+        other kinds always do.
+        """
+        if not self.codes:
+            return []
+        skippable = [kind in {LINE, QUAD} for kind in self.codes]
+        if np is not None:
+            coords = np.frombuffer(self.coords, dtype=np.float64)
+            ends = np.cumsum(np.asarray(ARITY)[np.frombuffer(self.codes, dtype=np.int8)]) - 2
+            return repeated_points(coords[ends], coords[ends + 1], precision, skippable)
+        coords = self.coords
+        ends = [end - 2 for end in accumulate(ARITY[kind] for kind in self.codes)]
+        xs, ys = [coords[i] for i in ends], [coords[i + 1] for i in ends]
+        return repeated_points(xs, ys, precision, skippable)
+
+
+def repeated_points(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    precision: int,
+    allowed: Sequence[bool] | None = None,
+) -> list[bool]:
+    """
+    Flag points that are the same_point as the last point not flagged.
+
+    The first point is never flagged, nor the points not allowed if
+    allowed is given. With numpy the rounded differences
+    between consecutive points are computed at once, then only the points
+    after a flagged one are compared again with the last point kept.
+    """
+    n = len(xs)
+    if np is None:
+        flags = [False] * n
+        starts: Iterable[int] = range(1, n)
+    else:
+        x, y = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        repeated = np.zeros(n, dtype=bool)
+        dx, dy = np.round(np.diff(x), precision), np.round(np.diff(y), precision)
+        repeated[1:] = (dx == 0) & (dy == 0)
+        if allowed is not None:
+            repeated &= np.asarray(allowed, dtype=bool)
+        flags = repeated.tolist()
+        starts = np.flatnonzero(repeated).tolist()
+    end = 0
+    for start in starts:
+        if start < end:
+            continue
+        # Flagged points do not move the current point
+        kx, ky = xs[start - 1], ys[start - 1]
+        end = start
+        while end < n:
+            same = same_point(kx, ky, xs[end], ys[end], precision)
+            flags[end] = same and (allowed is None or allowed[end])
+            end += 1
+            if not flags[end - 1]:
+                break
+    return flags
+
+
+def same_point(x1: float, y1: float, x2: float, y2: float, precision: int) -> bool:
+    """Float equivalent of geom.equals for 2D points."""
+    return round(x1 - x2, precision) == 0 and round(y1 - y2, precision) == 0
+
+
+class PathDataBuilder:
+    """
+    Build PathData from parsed path commands.
+    """
+
+    def __init__(self, precision: int) -> None:
+        self.precision = precision
+        self.data = PathData()
+        self.x = self.y = 0.0  # Current point
+        self.start_x = self.start_y = 0.0  # Start of the current subpath
+        self.last = 0  # Coordinate index of the last segment
+        self.begin(0.0, 0.0)
+
+    @property
+    def last_kind(self) -> int:
+        return self.data.codes[-1]
+
+    def append(self, kind: int, *coords: float) -> None:
+        data = self.data
+        self.last = len(data.coords)
+        data.codes.append(kind)
+        data.coords.extend(coords)
+        self.x, self.y = coords[-2], coords[-1]
+
+    def begin(self, x: float, y: float) -> None:
+        data = self.data
+        data.subpaths.append(len(data.codes))
+        data.subpaths.append(len(data.coords))
+        self.start_x, self.start_y = x, y
+        self.append(START, x, y)
+
+    def add_commands(self, commands: Iterable[tuple[str, list[float]]]) -> None:
+        for d, args in commands:
+            relative = d.islower()
+            smooth = d in "sStT"
+
+            if d in "LlMm" and args:
+                self.add_line(d, args, relative=relative)
+
+            elif d in "Hh":
+                self.add_horizontal(args, relative)
+
+            elif d in "Vv":
+                self.add_vertical(args, relative)
+
+            elif d in "Aa":
+                self.add_arc(args, relative)
+
+            elif d in "CcSs":
+                self.add_cubic_bezier(args, relative, smooth)
+
+            elif d in "QqTt":
+                self.add_quadratic_bezier(args, relative, smooth)
+
+            elif d in "Zz":
+                self.add_close()
+
+    def add_line(self, d: str, args: list[float], *, relative: bool) -> None:
+        pairs = zip(args[0::2], args[1::2], strict=False)
+        if d in "Mm":
+            if (pair := next(pairs, None)) is None:
+                return
+            x, y = pair
+            x, y = (self.x + x, self.y - y) if relative else (x, -y)
+            # if we're at the beginning of a wire we overwrite the start vector
+            if self.last_kind == START:
+                self.data.coords[self.last : self.last + 2] = array("d", (x, y))
+                self.x, self.y = x, y
+            else:
+                self.append(START, x, y)
+            self.start_x, self.start_y = x, y
+
+        for x, y in pairs:
+            if relative:
+                self.append(LINE, self.x + x, self.y - y)
+            else:
+                self.append(LINE, x, -y)
+
+    def add_horizontal(self, args: list[float], relative: bool) -> None:
+        for x in args:
+            self.append(LINE, x + self.x if relative else x, self.y)
+
+    def add_vertical(self, args: list[float], relative: bool) -> None:
+        for y in args:
+            self.append(LINE, self.x, self.y - y if relative else -y)
+
+    def add_arc(self, args: list[float], relative: bool) -> None:
+        for i in range(0, len(args) - 6, 7):
+            rx, ry, x_rotation, large_flag, sweep_flag, x, y = args[i : i + 7]
+            x, y = (self.x + x, self.y - y) if relative else (x, -y)
+            self.append(ARC, rx, ry, x_rotation, large_flag, sweep_flag, x, y)
+
+    def add_cubic_bezier(self, args: list[float], relative: bool, smooth: bool) -> None:
+        arity = 4 if smooth else 6
+        coords = self.data.coords
+        for i in range(0, len(args) - arity + 1, arity):
+            a = args[i : i + arity]
+            ox, oy = (self.x, self.y) if relative else (0.0, 0.0)
+            if smooth:
+                if self.last_kind == CUBIC:
+                    # Reflection of the previous second pole
+                    p1x = 2 * self.x - coords[self.last + 2]
+                    p1y = 2 * self.y - coords[self.last + 3]
+                else:
+                    p1x, p1y = self.x, self.y
+            else:
+                p1x, p1y = ox + a[0], oy - a[1]
+                a = a[2:]
+            self.append(CUBIC, p1x, p1y, ox + a[0], oy - a[1], ox + a[2], oy - a[3])
+
+    def add_quadratic_bezier(self, args: list[float], relative: bool, smooth: bool) -> None:
+        arity = 2 if smooth else 4
+        coords = self.data.coords
+        for i in range(0, len(args) - arity + 1, arity):
+            a = args[i : i + arity]
+            ox, oy = (self.x, self.y) if relative else (0.0, 0.0)
+            if smooth:
+                if self.last_kind == QUAD:
+                    # Reflection of the previous pole
+                    px = 2 * self.x - coords[self.last]
+                    py = 2 * self.y - coords[self.last + 1]
+                else:
+                    px, py = self.x, self.y
+            else:
+                px, py = ox + a[0], oy - a[1]
+                a = a[2:]
+            self.append(QUAD, px, py, ox + a[0], oy - a[1])
+
+    def add_close(self) -> None:
+        first_x, first_y = self.start_x, self.start_y
+        if same_point(self.x, self.y, first_x, first_y, self.precision):
+            # we assume identity of first and last at configured precision.
+            # So we have to make sure that they really are identical
+            self.correct_last(self.x - first_x, self.y - first_y)
+        else:
+            self.append(LINE, first_x, first_y)
+        self.begin(first_x, first_y)
+
+    def correct_last(self, dx: float, dy: float) -> None:
+        """
+        Move the end point of the last segment by (-dx, -dy).
+
+        Associated poles are moved accordingly.
+        """
+        coords, last = self.data.coords, self.last
+        kind = self.last_kind
+        if kind == CUBIC:
+            # for cubic beziers we also relocate the second pole
+            coords[last + 2] -= dx
+            coords[last + 3] -= dy
+        elif kind == QUAD:
+            # for quadratic beziers we also relocate the pole by half of the delta
+            coords[last] -= dx / 2
+            coords[last + 1] -= dy / 2
+        end = last + ARITY[kind] - 2
+        coords[end] -= dx
+        coords[end + 1] -= dy
+
+    def finish(self) -> PathData:
+        data = self.data
+        if data.codes[-1] == START and data.subpaths[-2] == len(data.codes) - 1:
+            # nothing more than the start preamble - delete.
+            data.codes.pop()
+            del data.coords[-2:]
+            del data.subpaths[-2:]
+        return data
@@ -5,11 +5,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from DraftVecUtils import equals  # type: ignore
 from FreeCAD import Vector  # type: ignore
-from Part import Face, LineSegment, Shape, Wire  # type: ignore
+from Part import Face, Shape  # type: ignore
+from Part import makePolygon as make_polygon  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, affine
+from .path_data import repeated_points
 from .shape import SvgShape
+from .geom import DraftPrecision, transform_shape
 from .cache import cached_copy
 
 
@@ -22,35 +25,36 @@ class SvgPolyLine(SvgShape):
 
     @cached_copy
     def to_shape(self) -> Shape | None:
-        # A simpler implementation would be
-        # _p = zip(points[0::2], points[1::2])
-        # sh = Part.makePolygon([Vector(svg_x,
-        #                               -svg_y,
-        #                               0) for svg_x, svg_y in _p])
-        #
-        # but it would be more difficult to search for duplicate
-        # points beforehand.
         points = self.points
         n = len(points)
         if not (n >= 4 and n % 2 == 0):
             return None
 
-        last_v = Vector(points[0], -points[1], 0)
-        path = []
+        xs, ys = points[0::2], points[1::2]
         if self.close:
-            points = points + points[:2]  # emulate closed path
-
-        for svg_x, svg_y in zip(points[2::2], points[3::2], strict=False):
-            current_v = Vector(svg_x, -svg_y, 0)
-            if not equals(last_v, current_v):
-                seg = LineSegment(last_v, current_v).toShape()
-                last_v = current_v
-                path.append(seg)
-
-        if path:
-            sh = Wire(path)
-            if self.style.fill_color and sh.isClosed():
-                sh = Face(sh)
-            return sh.transformGeometry(self.transform)
-
-        return None
+            # emulate closed path
+            xs, ys = [*xs, xs[0]], [*ys, ys[0]]
+
+        # Duplicated points are found in one pass over all coordinates,
+        # then the wire is built at once
+        repeated = repeated_points(xs, ys, DraftPrecision)
+        vertices = [Vector(x, -y, 0) for x, y, r in zip(xs, ys, repeated, strict=True) if not r]
+        if len(vertices) < 2:  # noqa: PLR2004
+            return None
+        if self.close and repeated[-1] and len(vertices) > 2:  # noqa: PLR2004
+            # Last point is on the start point at this precision, close exactly
+            vertices[-1] = vertices[0]
+
+        sh = make_polygon(vertices)
+        if self.style.fill_color and sh.isClosed():
+            sh = Face(sh)
+        return transform_shape(sh, self.transform)
+
+    def bounds(self) -> Bounds | None:
+        points = self.points
+        n = len(points)
+        if not (n >= 4 and n % 2 == 0):  # noqa: PLR2004
+            return None
+        builder = BoundsBuilder(affine(self.transform))
+        builder.points((x, -y) for x, y in zip(points[0::2], points[1::2], strict=True))
+        return builder.bounds
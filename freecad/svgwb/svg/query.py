@@ -0,0 +1,84 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from .database import lower_trim_list
+
+if TYPE_CHECKING:
+    from .database import SvgEntity
+    from .object import SvgObject, SvgObjectInfo
+
+_VALID_FIELDS = ("id", "label", "tag", "path", "group")
+
+
+def _like(pattern: str) -> str:
+    """Translate a '*' wildcard pattern into a regex, everything else is literal."""
+    return ".*".join(re.escape(part) for part in pattern.split("*"))
+
+
+class SvgQuery:
+    """
+    In memory equivalent of SvgDatabase.find_by_pattern.
+
+    Used to push queries down into the svg tree walk, so only matching
+    objects get their geometry built. Queries can be combined with `|`.
+    """
+
+    def __init__(self, patterns: list[str] | str = (), field: str = "id") -> None:
+        if field not in _VALID_FIELDS:
+            field = "id"
+        patterns = lower_trim_list(patterns)
+        if field == "group":
+            regexes = [f".*/{_like(p)}/.*" for p in patterns]
+        else:
+            regexes = [_like(p) for p in patterns]
+        self.terms: list[tuple[str, re.Pattern]] = []
+        self.path_prefixes: list[str] = []
+        if regexes:
+            self.terms.append((field, re.compile("|".join(regexes), re.DOTALL)))
+            if field == "path":
+                self.path_prefixes.extend(p.split("*", 1)[0] for p in patterns)
+
+    def __or__(self, other: SvgQuery) -> SvgQuery:
+        union = SvgQuery()
+        union.terms = self.terms + other.terms
+        union.path_prefixes = self.path_prefixes + other.path_prefixes
+        return union
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def matches(self, obj: SvgObject) -> bool:
+        return self._matches(obj.id, obj.shape.label, obj.shape.tag, obj.path)
+
+    def matches_entity(self, entity: SvgEntity | SvgObjectInfo) -> bool:
+        """Same as matches for a database row, or an index scan record."""
+        return self._matches(entity.id, entity.label, entity.tag, entity.path)
+
+    def _matches(self, obj_id: str, label: str, tag: str, path: str) -> bool:
+        for field, regex in self.terms:
+            match field:
+                case "id":
+                    value = obj_id
+                case "label":
+                    value = label
+                case "tag":
+                    value = tag
+                case _:
+                    value = path
+            if value and regex.fullmatch(value.lower()):
+                return True
+        return False
+
+    def may_contain(self, path: str) -> bool:
+        """Check if any object under the group at `path` can match."""
+        if any(field != "path" for field, _ in self.terms):
+            return True
+        group = f"{path.lower()}/"
+        return any(
+            prefix.startswith(group) or group.startswith(prefix) for prefix in self.path_prefixes
+        )
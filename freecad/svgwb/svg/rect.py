@@ -9,8 +9,9 @@ from FreeCAD import Vector, Matrix  # type: ignore
 from Part import Shape, LineSegment, Wire, Ellipse, Arc, Face  # type: ignore
 from DraftVecUtils import equals  # type: ignore
 
+from .bounds import Bounds, BoundsBuilder, affine
 from .shape import SvgShape
-from .geom import precision_step
+from .geom import precision_step, transform_shape
 from .cache import cached_copy
 import math
 
@@ -103,4 +104,10 @@ class SvgRect(SvgShape):
         sh = Wire(edges)
         if self.style.fill_color:
             sh = Face(sh)
-        return sh.transformGeometry(self.transform)
+        return transform_shape(sh, self.transform)
+
+    def bounds(self) -> Bounds | None:
+        x, y, w, h = self.x, -self.y, self.width, self.height
+        builder = BoundsBuilder(affine(self.transform))
+        builder.points(((x, y), (x + w, y), (x + w, y - h), (x, y - h)))
+        return builder.bounds
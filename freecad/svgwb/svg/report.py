@@ -0,0 +1,59 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+
+from .cache import CacheStats, shape_cache
+from .geom import WireStats, wire_stats
+
+
+@dataclass
+class ImportReport:
+    """Statistics of a geometry import, used to find pathological files."""
+
+    objects: int = 0
+    built: int = 0
+    # Objects whose geometry was read from the disk cache
+    reused: int = 0
+    deferred: int = 0
+    empty: int = 0
+    # Objects kept from the previous database by an incremental sync
+    unchanged: int = 0
+    wires: WireStats = field(default_factory=WireStats)
+    cache: CacheStats = field(default_factory=CacheStats)
+    # Ids of objects whose wires needed the slow fallbacks of make_wire
+    slow_objects: list[str] = field(default_factory=list)
+
+    def start(self) -> None:
+        wire_stats.reset()
+        shape_cache.stats.reset()
+
+    def track(self, obj_id: str, fallbacks_before: int) -> None:
+        if wire_stats.fallbacks > fallbacks_before:
+            self.slow_objects.append(obj_id)
+
+    def finish(self) -> None:
+        self.wires = replace(wire_stats)
+        self.cache = replace(shape_cache.stats)
+
+    def summary(self) -> str:
+        w = self.wires
+        lines = [
+            (
+                f"svg import: {self.objects} objects, {self.built} built "
+                f"({self.reused} from disk cache), "
+                f"{self.deferred} deferred, {self.empty} empty, {self.unchanged} unchanged"
+            ),
+            (
+                f"  wires: {w.direct} direct, {w.sorted} sorted, "
+                f"{w.connected} connected, {w.failed} failed"
+            ),
+            f"  shape cache: {self.cache}",
+        ]
+        if self.slow_objects:
+            shown = ", ".join(self.slow_objects[:20])
+            more = len(self.slow_objects) - 20
+            lines.append(f"  wire fallbacks in: {shown}{f' (+{more})' if more > 0 else ''}")
+        return "\n".join(lines)
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+from copy import copy
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .geom import transform_shape
+
 if TYPE_CHECKING:
+    from .bounds import Bounds
     from .options import SvgOptions
     from .style import SvgStyle
     from FreeCAD import Matrix, DocumentObject  # type: ignore
@@ -27,6 +31,36 @@ class SvgShape:
     def to_shape(self) -> Shape | None:
         return None
 
+    def with_transform(self, transform: Matrix) -> SvgShape:
+        """Shallow copy with another transformation and no cached geometry."""
+        sh = copy(self)
+        sh.transform = transform
+        for name in [name for name in vars(sh) if name.startswith("_cached_")]:
+            delattr(sh, name)
+        return sh
+
+    def placed(self, placement: Matrix) -> SvgShape:
+        """
+        Instance of this shape moved by placement, as created by <use>.
+
+        Instances, and their copies, share the geometry of the base shape:
+        it is built once and only transformed for each instance.
+        """
+        sh = self.with_transform(placement * self.transform)
+        if "_base" not in vars(sh) and self.transform.determinant():
+            sh._base = self  # noqa: SLF001
+        return sh
+
+    def place(self, shape: Shape | None) -> Shape | None:
+        """Move geometry built by the base shape to this instance."""
+        if shape is None:
+            return None
+        return transform_shape(shape, self.transform * self._base.transform.inverse())
+
+    def bounds(self) -> Bounds | None:
+        """Bounding box after transformation, computed without building geometry."""
+        return None
+
     def apply_style(self, obj: DocumentObject) -> None:
         vo = obj.ViewObject
         if self.style.stroke_color and hasattr(vo, "LineColor"):
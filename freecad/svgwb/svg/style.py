@@ -4,6 +4,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .parsers import parse_size
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 _SVG_COLORS = {
@@ -163,6 +169,8 @@ _SVG_COLORS_LOWER = {k.lower(): v for k, v in _SVG_COLORS.items()}
 class SvgColor:
     """Svg color parser/converter"""
 
+    __slots__ = ("source",)
+
     def __init__(self, source: str) -> None:
         self.source = source
 
@@ -230,7 +238,7 @@ class SvgColor:
         return (0.0, 0.0, 0.0, 0.0)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SvgStyle:
     """Supported svg styles"""
 
@@ -238,3 +246,92 @@ class SvgStyle:
     stroke_width: float | None = None
     fill_color: SvgColor | None = None
     font_size: int | None = None
+
+
+# Presentation attributes with the same meaning as their style property
+_PRESENTATION_ATTRS = ("fill", "stroke", "stroke-width", "font-size")
+
+
+class SvgStyleCache:
+    """
+    Per-document interning of resolved styles and colors.
+
+    Elements sharing the parent style and the same style related attributes
+    share the same immutable SvgStyle instance. Every resolved style is kept
+    alive by the cache, so parent identity is a stable key.
+    """
+
+    def __init__(self) -> None:
+        self._styles: dict[tuple, SvgStyle] = {}
+        self._colors: dict[str, SvgColor] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def color(self, source: str) -> SvgColor:
+        if (color := self._colors.get(source)) is None:
+            color = self._colors[source] = SvgColor(source)
+        return color
+
+    def style(
+        self,
+        stroke_color: str | None = None,
+        stroke_width: float | None = None,
+        fill_color: str | None = None,
+        font_size: int | None = None,
+    ) -> SvgStyle:
+        """Create an interned style from raw values."""
+        return SvgStyle(
+            self.color(stroke_color) if stroke_color else None,
+            stroke_width,
+            self.color(fill_color) if fill_color else None,
+            font_size,
+        )
+
+    def resolve(self, parent: SvgStyle, attrs: Mapping[str, str], dpi: float) -> SvgStyle:
+        """Resolve the style of an element from its attributes and its parent style."""
+        get = attrs.get
+        key = (
+            id(parent),
+            dpi,
+            get("style"),
+            get("fill"),
+            get("stroke"),
+            get("stroke-width"),
+            get("font-size"),
+        )
+        if (style := self._styles.get(key)) is not None:
+            self.hits += 1
+            return style
+        self.misses += 1
+        style = self._styles[key] = self._resolve(parent, attrs, dpi)
+        return style
+
+    def _resolve(self, parent: SvgStyle, attrs: Mapping[str, str], dpi: float) -> SvgStyle:
+        data = {name: value for name in _PRESENTATION_ATTRS if (value := attrs.get(name))}
+        # Style properties take precedence over presentation attributes
+        pairs = attrs.get("style", "").split(";")
+        pairs = (tuple(v.strip() for v in pair.split(":")) for pair in pairs)
+        data.update(v for v in pairs if len(v) == 2)  # noqa: PLR2004
+
+        fill_color = data.get("fill")
+        stroke_color = data.get("stroke")
+        stroke_width = data.get("stroke-width")
+        font_size = data.get("font-size")
+        mode = f"css{dpi!s}"
+
+        fill = None
+        if fill_color and fill_color != "none":
+            fill = self.color(fill_color)
+        stroke = parent.stroke_color
+        if stroke_color and stroke_color != "none":
+            stroke = self.color(stroke_color)
+        width = parent.stroke_width
+        if stroke_width and stroke_width != "none":
+            width = parse_size(stroke_width, mode)
+        size = parent.font_size
+        if font_size:
+            size = parse_size(font_size, mode)
+        return SvgStyle(stroke, width, fill, size)
+
+    def __len__(self) -> int:
+        return len(self._styles)
@@ -6,6 +6,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from FreeCAD import Vector, Placement, Document, DocumentObject  # type: ignore
+from .bounds import Bounds, BoundsBuilder, affine
 from .shape import SvgShape
 
 
@@ -45,6 +46,11 @@ class SvgText(SvgShape):
         obj.Placement = placement
         return obj
 
+    def bounds(self) -> Bounds | None:
+        builder = BoundsBuilder(affine(self.transform))
+        builder.point(self.x, -self.y)
+        return builder.bounds
+
     def append(self, content: str) -> None:
         self._raw_text.append(content)
 
@@ -4,13 +4,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import copy
 from .shape import SvgShape
 from .cache import cached_copy, cached_copy_list, cached_property
-from .object import SvgObject
+from .object import SvgObject, build_shapes
 from typing import TYPE_CHECKING
 from .parsers import parse_svg_transform
 from FreeCAD import Matrix, Vector  # type: ignore
+from Part import makeCompound as make_compound  # type: ignore
 
 if TYPE_CHECKING:
     from .index import SvgIndex
@@ -37,20 +37,17 @@ class SvgUse(SvgShape):
 
     @cached_copy
     def to_shape(self) -> Shape | None:
-        if (target := self.index.find(self.href)) and (sh := target.to_shape()):
-            return sh.transformGeometry(self.transform * self.move)
-        return None
+        target = self.index.find(self.href)
+        if not target:
+            return None
+        if hasattr(target, "objects"):
+            shapes = self.shapes()
+            return make_compound(shapes) if shapes else None
+        return self.objects[0].shape.to_shape()
 
     @cached_copy_list
     def shapes(self) -> list[Shape]:
-        target = self.index.find(self.href)
-        if not target:
-            return []
-        if hasattr(target, "shapes"):
-            results = target.shapes()
-        else:
-            results = [target.to_shape()]
-        return [s.transformGeometry(self.transform * self.move) for s in results if s]
+        return build_shapes(self.objects)
 
     @cached_property
     def objects(self) -> list[SvgObject]:
@@ -80,6 +77,4 @@ class SvgUse(SvgShape):
         return objects
 
     def transformed(self, shape: SvgShape) -> SvgShape:
-        sh = copy.copy(shape)
-        sh.transform = self.transform * sh.transform * self.move
-        return sh
+        return shape.placed(self.transform * self.move)
@@ -6,7 +6,15 @@ from ..vendor.fcapi.lang import QT_TRANSLATE_NOOP
 from ..config import resources, commands
 
 # Import commands to register them
-from ..commands import import_svg, export_svg, create_svg_file_object, paste_svg, sync_all, copy_svg  # noqa: F401
+from ..commands import (  # noqa: F401
+    import_svg,
+    export_svg,
+    create_svg_file_object,
+    paste_svg,
+    sync_all,
+    copy_svg,
+    clear_cache,
+)
 
 
 class SvgWorkbench(Workbench):
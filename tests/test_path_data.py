@@ -0,0 +1,77 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""Zero length segment detection of svg path data."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("FreeCAD")
+
+from freecad.svgwb.svg import path_data
+from freecad.svgwb.svg.path_data import PathData, repeated_points, same_point
+
+# (xs, ys, expected flags) at precision 6
+REPEATED = (
+    ([], [], []),
+    ([1.0], [1.0], [False]),
+    # Closer than the resolution across a rounding boundary
+    ([0.4999999e-6, 0.5000001e-6], [0.0, 0.0], [False, True]),
+    # Almost one resolution step apart on the same rounding cell
+    ([0.51e-6, 1.49e-6], [0.0, 0.0], [False, False]),
+    # Skipped points do not move the current point
+    ([0.0, 0.4e-6, 0.8e-6, 1.2e-6], [0.0, 0.0, 0.0, 0.0], [False, True, False, True]),
+    ([0.0, 0.0, 0.0, 1.0, 1.0], [0.0, 0.0, 0.0, 0.0, 0.0], [False, True, True, False, True]),
+)
+
+
+def sequential(xs: list[float], ys: list[float], precision: int) -> list[bool]:
+    flags = [False] * len(xs)
+    for i in range(1, len(xs)):
+        j = max(j for j in range(i) if not flags[j])
+        flags[i] = same_point(xs[j], ys[j], xs[i], ys[i], precision)
+    return flags
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(path_data, "np", None)
+
+
+@pytest.mark.usefixtures("backend")
+@pytest.mark.parametrize(("xs", "ys", "expected"), REPEATED)
+def test_repeated_points(xs: list[float], ys: list[float], expected: list[bool]) -> None:
+    assert repeated_points(xs, ys, 6) == expected
+
+
+@pytest.mark.usefixtures("backend")
+def test_repeated_points_same_as_sequential() -> None:
+    rnd = random.Random(19)  # noqa: S311
+    xs, ys = [0.0], [0.0]
+    for _ in range(2000):
+        step = rnd.choice((0.0, 0.3e-6, 0.6e-6, 1.0))
+        xs.append(xs[-1] + rnd.uniform(-step, step))
+        ys.append(ys[-1] + rnd.uniform(-step, step))
+    assert repeated_points(xs, ys, 6) == sequential(xs, ys, 6)
+
+
+@pytest.mark.usefixtures("backend")
+def test_degenerate() -> None:
+    data = PathData.from_commands(
+        [
+            ("M", [0, 0]),
+            ("l", [0.4e-6, 0]),
+            ("l", [0.4e-6, 0]),
+            ("c", [0, 1, 0, 1, 0, 0]),
+            ("l", [0.4e-6, 0]),
+            ("q", [1, 1, 0, 0]),
+        ],
+        6,
+    )
+    assert data.degenerate(6) == [False, True, False, False, True, True]
@@ -0,0 +1,57 @@
+# SPDX-License: LGPL-2.1-or-later
+# (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
+
+"""Svg path data tokenizer corpus."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("FreeCAD")
+
+from freecad.svgwb.svg.parsers import tokenize_path
+
+# (path data, expected tokens)
+CORPUS = (
+    ("M 10 20 L 30 40 Z", [("M", [10, 20]), ("L", [30, 40]), ("Z", [])]),
+    ("M10,20L30,40z", [("M", [10, 20]), ("L", [30, 40]), ("z", [])]),
+    ("M1.5.5", [("M", [1.5, 0.5])]),
+    ("m.5.5.5.5", [("m", [0.5, 0.5, 0.5, 0.5])]),
+    ("M0-1-2-3", [("M", [0, -1, -2, -3])]),
+    ("M1e2-3E-1", [("M", [100, -0.3])]),
+    ("M1.e1.5", [("M", [10, 0.5])]),
+    ("M+1+2", [("M", [1, 2])]),
+    ("a1 1 0 00 1 1", [("a", [1, 1, 0, 0, 0, 1, 1])]),
+    ("a1 1 0 1110 10", [("a", [1, 1, 0, 1, 1, 10, 10])]),
+    ("A5,5,0,1,0,30,40 5 5 0 0110 10", [("A", [5, 5, 0, 1, 0, 30, 40, 5, 5, 0, 0, 1, 10, 10])]),
+    ("M0 0a2 2 0 01.5.5", [("M", [0, 0]), ("a", [2, 2, 0, 0, 1, 0.5, 0.5])]),
+    ("M0\n0\tL\r\n1 , 1", [("M", [0, 0]), ("L", [1, 1])]),
+    ("M1 2,", [("M", [1, 2])]),
+    ("  ", []),
+)
+
+# Malformed data: the path is kept up to the first error, the command in
+# error keeps its complete segments only
+MALFORMED = (
+    ("M0 0A 10 10 0 2 1 5 5L1 1", [("M", [0, 0]), ("A", [])]),
+    ("M0 0a1 1 0 0 1 2 2 1 1 0 0 0x 3 3", [("M", [0, 0]), ("a", [1, 1, 0, 0, 1, 2, 2])]),
+    ("M0 0a1 1 0 0 1e5 2 2", [("M", [0, 0]), ("a", [])]),
+    ("M0 0L1 1 #2 2L3 3", [("M", [0, 0]), ("L", [1, 1])]),
+    ("M 1 1 L 2 x 3", [("M", [1, 1]), ("L", [])]),
+    ("M 1 1 L 2 3 4 Z", [("M", [1, 1]), ("L", [2, 3])]),
+    ("M0 0L1e 2", [("M", [0, 0]), ("L", [])]),
+    ("M0 0 L Z", [("M", [0, 0]), ("L", [])]),
+    ("M0 0Z 1 1", [("M", [0, 0]), ("Z", [])]),
+    ("x M0 0", []),
+    ("1 2 M0 0", []),
+)
+
+
+@pytest.mark.parametrize(("d", "expected"), CORPUS)
+def test_tokenize_path(d: str, expected: list[tuple[str, list[float]]]) -> None:
+    assert tokenize_path(d) == expected
+
+
+@pytest.mark.parametrize(("d", "expected"), MALFORMED)
+def test_tokenize_malformed_path(d: str, expected: list[tuple[str, list[float]]]) -> None:
+    assert tokenize_path(d) == expected